@@ -1,5 +1,8 @@
 import bpy, bmesh
+import numpy as np
 from mathutils import Vector
+from collections import deque
+import hashlib
 import os
 import sys
 import json
@@ -13,9 +16,18 @@ import json
 #TEST_OUTPUT_DIR = ""     # Change this to your output directory
 
 # Parse CLI arguments passed after `--`
+MANIFEST_PATH = None
 if "--" in sys.argv:
     argv = sys.argv[sys.argv.index("--") + 1:]
-    if len(argv) >= 2:
+    if len(argv) >= 2 and argv[0] == "--manifest":
+        # Batch mode: a JSON manifest of jobs, all run in this one Blender
+        # session (see run_blender_manifest in pipeline/triggerBlender.py)
+        MANIFEST_PATH = argv[1]
+        TEST_OBJ_PATH = None
+        TEST_OUTPUT_DIR = None
+        MAX_TILE_LEVEL = 3
+        FIRST_SPLIT_ONLY = False
+    elif len(argv) >= 2:
         TEST_OBJ_PATH = argv[0]
         TEST_OUTPUT_DIR = argv[1]
         # Optional third argument for max LOD level
@@ -23,7 +35,7 @@ if "--" in sys.argv:
         # Optional fourth argument for first-split-only mode (Phase 3 parallel processing)
         FIRST_SPLIT_ONLY = (argv[3] == "--first-split-only") if len(argv) >= 4 else False
     else:
-        print("❌ Error: Expected at least 2 arguments after '--': input_path output_dir [max_lod] [--first-split-only]")
+        print("❌ Error: Expected at least 2 arguments after '--': input_path output_dir [max_lod] [--first-split-only] or --manifest manifest.json")
         sys.exit(1)
 else:
     print("❌ Error: Missing '--' in arguments. Blender CLI should use '--' before script args.")
@@ -163,11 +175,13 @@ def generate_texture_metadata(obj, output_dir, triangle_threshold):
 total_exported = 0
 total_decimated = 0
 
-# Performance optimization: Cache for triangle counts
-triangle_count_cache = {}
-
 # Performance optimization: Cache for created directories to avoid repeated os.makedirs checks
 created_directories = set()
+
+# Finalized tiles accumulated during the recursion and exported in one batch
+# at the end of the run, so the selection/exporter setup cost is paid per run
+# rather than per tile
+pending_exports = []
 def clear_scene(self):
     """Clear all objects from the scene"""
     bpy.ops.object.select_all(action='SELECT')
@@ -193,6 +207,7 @@ def cleanup_mesh(obj):
     bm.to_mesh(obj.data)
     obj.data.update()
     bm.free()
+    invalidate_triangle_count(obj)
 
     # Report results
     new_verts = len(obj.data.vertices)
@@ -203,39 +218,48 @@ def cleanup_mesh(obj):
 
 def get_bounds(obj, local=True):
     """Get the bounding box of an object"""
-    if local:
-        coords = obj.bound_box
-    else:
-        coords = [obj.matrix_world @ Vector(c) for c in obj.bound_box]
-    xs = [p[0] for p in coords]; ys = [p[1] for p in coords]; zs = [p[2] for p in coords]
-    return (min(xs), max(xs)), (min(ys), max(ys)), (min(zs), max(zs))
+    # One numpy array over the 8 corners replaces eight Vector builds and
+    # three list comprehensions; world-space corners come from a single
+    # matmul with the homogeneous transform instead of 8 Vector multiplies
+    pts = np.array([tuple(c) for c in obj.bound_box], dtype=np.float64)
+    if not local:
+        m = np.array(obj.matrix_world, dtype=np.float64)
+        pts = (pts @ m[:3, :3].T) + m[:3, 3]
+    mins = pts.min(axis=0)
+    maxs = pts.max(axis=0)
+    return (mins[0], maxs[0]), (mins[1], maxs[1]), (mins[2], maxs[2])
 
 def get_triangle_count(obj):
     """Get the number of triangles in a mesh object (with caching for performance)"""
-    global triangle_count_cache
-
     if obj.type != 'MESH' or not obj.data:
         return 0
 
-    # Create cache key based on object name and geometry signature
-    # Using vertex/polygon counts as a quick signature
-    cache_key = (obj.name, len(obj.data.vertices), len(obj.data.polygons))
-
-    # Check cache first
-    if cache_key in triangle_count_cache:
-        return triangle_count_cache[cache_key]
+    # The count is cached as a custom property on the object itself, so it
+    # travels with the object through the recursion and needs no global
+    # keyed on name/signature. decimate_object invalidates it on change.
+    cached = obj.get("_tri_count")
+    if cached is not None:
+        return cached
+
+    # Calculate triangle count if not cached. Triangulating an n-gon yields
+    # n-2 triangles, so one foreach_get over loop totals replaces the old
+    # build-a-bmesh-and-triangulate approach (a full mesh copy per call).
+    num_polys = len(obj.data.polygons)
+    if num_polys == 0:
+        triangle_count = 0
+    else:
+        loop_totals = np.empty(num_polys, dtype=np.int32)
+        obj.data.polygons.foreach_get("loop_total", loop_totals)
+        triangle_count = int((loop_totals - 2).sum())
 
-    # Calculate triangle count if not cached
-    bm = bmesh.new()
-    bm.from_mesh(obj.data)
-    bmesh.ops.triangulate(bm, faces=bm.faces)
-    triangle_count = len(bm.faces)
-    bm.free()
+    obj["_tri_count"] = triangle_count
+    return triangle_count
 
-    # Store in cache
-    triangle_count_cache[cache_key] = triangle_count
 
-    return triangle_count
+def invalidate_triangle_count(obj):
+    """Drop the cached count after an operation that changes geometry"""
+    if "_tri_count" in obj:
+        del obj["_tri_count"]
 
 def duplicate_object(obj, new_name):
     """Create a duplicate of an object with a new name"""
@@ -258,6 +282,64 @@ def duplicate_object(obj, new_name):
     
     return new_obj
 
+# Optional cross-run decimation cache (opt-in via the MESH2TILE_CACHE_DIR
+# environment variable). Re-runs over the same source geometry - common while
+# tuning pipeline settings - reload the decimated mesh instead of redoing the
+# decimation, keyed by a content hash of the vertex coordinates.
+DECIMATE_CACHE_DIR = os.environ.get("MESH2TILE_CACHE_DIR")
+
+def _decimation_cache_path(obj, target_triangles):
+    """Cache file keyed by vertex-coordinate hash and target triangle count"""
+    coords = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    obj.data.vertices.foreach_get("co", coords)
+    digest = hashlib.blake2b(coords.tobytes(), digest_size=16).hexdigest()
+    return os.path.join(DECIMATE_CACHE_DIR, f"{digest}_{target_triangles}.obj")
+
+def _load_cached_decimation(obj, cache_path):
+    """Swap obj's mesh for the cached decimated mesh, keeping its materials"""
+    try:
+        bpy.ops.object.select_all(action='DESELECT')
+        bpy.ops.wm.obj_import(filepath=cache_path)
+        imported = [o for o in bpy.context.selected_objects if o.type == 'MESH']
+        if not imported:
+            return False
+
+        cached_mesh = imported[0].data
+        # The cache stores geometry + UVs only; reattach the object's own
+        # material datablocks (slot order matches the source mesh)
+        cached_mesh.materials.clear()
+        for mat in obj.data.materials:
+            cached_mesh.materials.append(mat)
+
+        old_mesh = obj.data
+        obj.data = cached_mesh
+        for o in imported:
+            bpy.data.objects.remove(o, do_unlink=True)
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+        invalidate_triangle_count(obj)
+        return True
+    except Exception as e:
+        print(f"  Decimation cache load failed ({e}) - decimating normally")
+        return False
+
+def _store_cached_decimation(obj, cache_path):
+    try:
+        os.makedirs(DECIMATE_CACHE_DIR, exist_ok=True)
+        bpy.ops.object.select_all(action='DESELECT')
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.wm.obj_export(
+            filepath=cache_path,
+            export_selected_objects=True,
+            export_materials=False,
+            export_uv=True,
+            apply_modifiers=False,
+            global_scale=1.0
+        )
+    except Exception as e:
+        print(f"  Decimation cache store failed ({e})")
+
 def decimate_object(obj, target_triangles):
     """Decimate an object to target triangle count"""
     global total_decimated
@@ -268,22 +350,44 @@ def decimate_object(obj, target_triangles):
         return obj
     
     print(f"  Decimating {obj.name} from {current_triangles} to {target_triangles} triangles")
-    
+
+    # Reuse a previously decimated mesh for identical input when caching is on
+    cache_path = None
+    if DECIMATE_CACHE_DIR:
+        cache_path = _decimation_cache_path(obj, target_triangles)
+        if os.path.exists(cache_path) and _load_cached_decimation(obj, cache_path):
+            print(f"    Loaded from decimation cache: {get_triangle_count(obj)} triangles")
+            total_decimated += 1
+            return obj
+
     # Calculate decimation ratio
     ratio = target_triangles / current_triangles
-    
-    # Apply decimation modifier
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    
+
     # Add decimate modifier
     decimate_mod = obj.modifiers.new(name="Decimate", type='DECIMATE')
     decimate_mod.ratio = ratio
     decimate_mod.use_collapse_triangulate = True
-    
-    # Apply modifier
-    bpy.ops.object.modifier_apply(modifier="Decimate")
-    
+
+    # Evaluate the modifier stack through the depsgraph and swap the result
+    # mesh in, instead of bpy.ops.object.modifier_apply which needs the object
+    # selected + active and forces an extra depsgraph update per tile
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    decimated_mesh = bpy.data.meshes.new_from_object(eval_obj)
+    decimated_mesh.name = obj.data.name
+
+    obj.modifiers.clear()
+    old_mesh = obj.data
+    for mat in old_mesh.materials:
+        decimated_mesh.materials.append(mat)
+    obj.data = decimated_mesh
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+    invalidate_triangle_count(obj)
+
+    if cache_path:
+        _store_cached_decimation(obj, cache_path)
+
     final_triangles = get_triangle_count(obj)
     print(f"    Result: {final_triangles} triangles (ratio: {ratio:.3f})")
     total_decimated += 1
@@ -307,15 +411,41 @@ def create_chunk_with_materials(bm, chunk_name, original_obj):
         material_layer = bm.faces.layers.int["material_index"]
         bm.faces.ensure_lookup_table()
 
-        for i, poly in enumerate(me.polygons):
-            if i < len(bm.faces):
-                stored_mat_index = bm.faces[i][material_layer]
-                poly.material_index = min(stored_mat_index, len(me.materials) - 1)
+        # Gather the layer once, clamp, and write all polygons in one
+        # foreach_set call instead of assigning per-poly through the
+        # slow bpy_prop_collection path
+        stored = np.fromiter((f[material_layer] for f in bm.faces),
+                             dtype=np.int32, count=len(bm.faces))
+        np.clip(stored, 0, max(len(me.materials) - 1, 0), out=stored)
+        if len(stored) >= len(me.polygons):
+            me.polygons.foreach_set("material_index", stored[:len(me.polygons)])
+        else:
+            for i, poly in enumerate(me.polygons):
+                if i < len(stored):
+                    poly.material_index = int(stored[i])
     
     ob = bpy.data.objects.new(chunk_name, me)
     bpy.context.collection.objects.link(ob)
     return ob
 
+# Small freelist of bmesh instances reused across octant builds: clear()
+# resets a bmesh far more cheaply than a free()+new() pair, which hits
+# Blender's allocator 9 times per bisection (source + 8 octants).
+_BM_POOL = []
+_BM_POOL_CAP = 8
+
+def get_bm():
+    """Take a bmesh from the pool, or allocate one if the pool is empty"""
+    return _BM_POOL.pop() if _BM_POOL else bmesh.new()
+
+def put_bm(bm):
+    """Return a bmesh to the pool (cleared), freeing it if the pool is full"""
+    if len(_BM_POOL) < _BM_POOL_CAP:
+        bm.clear()
+        _BM_POOL.append(bm)
+    else:
+        bm.free()
+
 def bisect_object_octree(obj, tile_level, ix, iy, iz):
     """
     Bisect an object into 8 octree chunks (2x2x2) using optimized spatial partitioning
@@ -342,37 +472,58 @@ def bisect_object_octree(obj, tile_level, ix, iy, iz):
     z_mid = (zmin + zmax) / 2
 
     # Create bmesh from object
-    bm_orig = bmesh.new()
+    bm_orig = get_bm()
     obj.data.update()
     bm_orig.from_mesh(obj.data)
     bm_orig.faces.ensure_lookup_table()
     bm_orig.verts.ensure_lookup_table()
 
     # Store material indices (we'll need these when creating chunks)
-    face_materials = []
-    if len(obj.data.materials) > 0:
-        for i, face in enumerate(bm_orig.faces):
-            poly_index = i if i < len(obj.data.polygons) else 0
-            mat_idx = obj.data.polygons[poly_index].material_index
-            face_materials.append(mat_idx)
+    # foreach_get pulls all indices in one C call instead of N slow
+    # bpy_prop_collection accesses; tolist() keeps per-face lookups cheap
+    num_faces = len(bm_orig.faces)
+    if len(obj.data.materials) > 0 and len(obj.data.polygons) > 0:
+        mat_indices = np.zeros(len(obj.data.polygons), dtype=np.int32)
+        obj.data.polygons.foreach_get("material_index", mat_indices)
+        face_materials = mat_indices[:num_faces].tolist()
+        if len(face_materials) < num_faces:
+            face_materials += [0] * (num_faces - len(face_materials))
     else:
-        face_materials = [0] * len(bm_orig.faces)
+        face_materials = [0] * num_faces
 
     # OPTIMIZATION: Single-pass spatial partitioning
     # Assign each face to an octant based on its centroid
     octant_faces = {(dx, dy, dz): [] for dx in range(2) for dy in range(2) for dz in range(2)}
 
-    for face_idx, face in enumerate(bm_orig.faces):
-        # Calculate face centroid
-        centroid = face.calc_center_median()
-
-        # Determine octant (0 or 1 for each axis)
-        dx = 0 if centroid.x < x_mid else 1
-        dy = 0 if centroid.y < y_mid else 1
-        dz = 0 if centroid.z < z_mid else 1
-
-        # Store face index and material for this octant
-        octant_faces[(dx, dy, dz)].append((face_idx, face_materials[face_idx]))
+    if num_faces == len(obj.data.polygons):
+        # Polygon centers come straight off the mesh in one foreach_get and
+        # the octant tests run as three vectorized comparisons, instead of a
+        # Python loop calling calc_center_median per face
+        centers = np.empty(num_faces * 3, dtype=np.float64)
+        obj.data.polygons.foreach_get("center", centers)
+        centers = centers.reshape(-1, 3)
+        octant_dx = (centers[:, 0] >= x_mid).astype(np.int8)
+        octant_dy = (centers[:, 1] >= y_mid).astype(np.int8)
+        octant_dz = (centers[:, 2] >= z_mid).astype(np.int8)
+        octant_keys = octant_dx * 4 + octant_dy * 2 + octant_dz
+        # A single stable argsort groups the faces of all 8 octants at once,
+        # replacing eight full re-scans of octant_keys (one np.nonzero per
+        # octant) with one pass plus slicing
+        order = np.argsort(octant_keys, kind='stable')
+        boundaries = np.searchsorted(octant_keys[order], np.arange(9))
+        for code in range(8):
+            indices = order[boundaries[code]:boundaries[code + 1]]
+            octant_faces[(code >> 2, (code >> 1) & 1, code & 1)] = [
+                (i, face_materials[i]) for i in indices.tolist()]
+    else:
+        # bmesh face count drifted from the mesh (shouldn't happen right
+        # after from_mesh) - keep the per-face bmesh path as a fallback
+        for face_idx, face in enumerate(bm_orig.faces):
+            centroid = face.calc_center_median()
+            dx = 0 if centroid.x < x_mid else 1
+            dy = 0 if centroid.y < y_mid else 1
+            dz = 0 if centroid.z < z_mid else 1
+            octant_faces[(dx, dy, dz)].append((face_idx, face_materials[face_idx]))
 
     chunks = []
 
@@ -401,7 +552,7 @@ def bisect_object_octree(obj, tile_level, ix, iy, iz):
                 print(f"    Processing chunk {chunk_name} (dx:{dx}, dy:{dy}, dz:{dz})")
 
                 # Create new bmesh for this chunk
-                bm_chunk = bmesh.new()
+                bm_chunk = get_bm()
 
                 # CRITICAL: Copy UV layers from original mesh
                 # Without UVs, texture baking will produce black textures!
@@ -457,9 +608,14 @@ def bisect_object_octree(obj, tile_level, ix, iy, iz):
                         me.materials.append(mat)
 
                     # Restore material assignments (only for faces that were actually created)
-                    for face_idx, mat_idx in enumerate(created_faces_materials):
-                        if face_idx < len(me.polygons):
-                            me.polygons[face_idx].material_index = mat_idx
+                    if created_faces_materials:
+                        chunk_mats = np.asarray(created_faces_materials, dtype=np.int32)
+                        if len(chunk_mats) == len(me.polygons):
+                            me.polygons.foreach_set("material_index", chunk_mats)
+                        else:
+                            for face_idx, mat_idx in enumerate(created_faces_materials):
+                                if face_idx < len(me.polygons):
+                                    me.polygons[face_idx].material_index = mat_idx
 
                     # Create object
                     chunk_obj = bpy.data.objects.new(chunk_name, me)
@@ -470,9 +626,9 @@ def bisect_object_octree(obj, tile_level, ix, iy, iz):
                 else:
                     print(f"      Chunk {chunk_name} is empty - skipping")
 
-                bm_chunk.free()
+                put_bm(bm_chunk)
 
-    bm_orig.free()
+    put_bm(bm_orig)
     print(f"    Created {len(chunks)} non-empty chunks")
     return chunks
 
@@ -528,58 +684,124 @@ def export_object_test(obj, output_dir):
 
     total_exported += 1
 
-def process_object_adaptive(obj, tile_level=0, ix=0, iy=0, iz=0, max_level=MAX_TILE_LEVEL):
+def queue_export(obj):
+    """Defer exporting a finalized tile to one batched pass at the end"""
+    pending_exports.append(obj)
+    print(f"  Queued {obj.name} for export ({get_triangle_count(obj)} triangles)")
+
+def export_pending_objects(output_dir):
+    """Export all queued tiles in one pass.
+
+    Tiles stay one-OBJ-per-file (the GLB conversion and tileset URIs depend
+    on that), but the selection state is managed directly: everything is
+    deselected once up front and each tile's selection is toggled around its
+    export, instead of running the select_all operator per tile.
+
+    Exports run on the main thread by necessity: bpy.ops (including
+    wm.obj_export) is not thread-safe, so the write cannot be handed to a
+    background thread to overlap with the next tile's geometry work.
+    Batching at the end of the run is the closest safe equivalent - the
+    per-export operator setup is paid once, and overlapping with compute
+    happens one level up, where mesh2tile runs whole chunks in parallel
+    worker processes.
     """
-    Recursively process an object with adaptive tiling
-    """
-    print(f"\n=== Processing object {obj.name} at tile level {tile_level} ===")
-    
-    triangle_count = get_triangle_count(obj)
-    print(f"Triangle count: {triangle_count}")
-    
-    # Check if we need to tile this object
-    if triangle_count <= TRIANGLE_THRESHOLD:
-        print(f"Object has ≤ {TRIANGLE_THRESHOLD} triangles - exporting as is")
-        export_object_test(obj, TEST_OUTPUT_DIR)
-        return
-    
-    if tile_level >= max_level:
-        print(f"Maximum tile level ({max_level}) reached - decimating and exporting")
-        decimate_object(obj, TRIANGLE_THRESHOLD)
-        export_object_test(obj, TEST_OUTPUT_DIR)
+    global total_exported, created_directories
+
+    if not pending_exports:
         return
-    
-    print(f"Object exceeds {TRIANGLE_THRESHOLD} triangles - tiling...")
-    
-    # Duplicate the object
-    decimated_name = f"{tile_level}_{ix}_{iy}_{iz}_decimated"
-    decimated_obj = duplicate_object(obj, decimated_name)
-    
-    # Decimate the duplicate
-    decimate_object(decimated_obj, TRIANGLE_THRESHOLD)
-    export_object_test(decimated_obj, TEST_OUTPUT_DIR)
-    
-    # For testing, we might want to keep the decimated object visible
-    # Remove the decimated object from scene (we've exported it)
-    # bpy.data.objects.remove(decimated_obj, do_unlink=True)
-    
-    # Bisect the original object into octree
-    chunks = bisect_object_octree(obj, tile_level + 1, ix, iy, iz)
-    
-    # Remove the original object (it's been split)
+
+    print(f"\nExporting {len(pending_exports)} queued tiles...")
+    for o in bpy.context.view_layer.objects:
+        o.select_set(False)
+
+    for obj in pending_exports:
+        tile_level = get_tile_level_from_name(obj.name)
+        clean_name = clean_object_name(obj.name)
+
+        tile_folder = os.path.join(output_dir, f"TileLevel_{tile_level}")
+        if tile_folder not in created_directories:
+            os.makedirs(tile_folder, exist_ok=True)
+            created_directories.add(tile_folder)
+
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+
+        output_file = os.path.join(tile_folder, f"{clean_name}.obj")
+        bpy.ops.wm.obj_export(
+            filepath=output_file,
+            export_selected_objects=True,
+            export_materials=True,
+            export_uv=True,
+            apply_modifiers=False,
+            global_scale=1.0
+        )
+        obj.select_set(False)
+        print(f"    Exported: {output_file}")
+        total_exported += 1
+
+    pending_exports.clear()
+
+def remove_object_and_mesh(obj):
+    """Remove an object together with its mesh datablock when unused"""
+    mesh = obj.data
     bpy.data.objects.remove(obj, do_unlink=True)
-    
-    # Recursively process each chunk
-    for chunk in chunks:
-        # Parse chunk name to get coordinates
-        parts = chunk.name.split('_')
-        if len(parts) >= 4:
-            chunk_tile_level = int(parts[0])
-            chunk_ix = int(parts[1])
-            chunk_iy = int(parts[2])
-            chunk_iz = int(parts[3])
-            
-            process_object_adaptive(chunk, chunk_tile_level, chunk_ix, chunk_iy, chunk_iz, max_level)
+    if mesh and mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+
+def process_object_adaptive(obj, tile_level=0, ix=0, iy=0, iz=0, max_level=MAX_TILE_LEVEL):
+    """
+    Process an object with adaptive tiling.
+
+    Uses an explicit work queue walked depth-first instead of recursion:
+    each parent (object and mesh datablock) is freed as soon as its chunks
+    exist, so peak memory holds one path through the octree rather than
+    every sibling at every level.
+    """
+    work_queue = deque([(obj, tile_level, ix, iy, iz)])
+    while work_queue:
+        # pop() walks depth-first so only one octree path is alive at a time
+        obj, tile_level, ix, iy, iz = work_queue.pop()
+
+        print(f"\n=== Processing object {obj.name} at tile level {tile_level} ===")
+
+        triangle_count = get_triangle_count(obj)
+        print(f"Triangle count: {triangle_count}")
+
+        # Check if we need to tile this object
+        if triangle_count <= TRIANGLE_THRESHOLD:
+            print(f"Object has ≤ {TRIANGLE_THRESHOLD} triangles - exporting as is")
+            queue_export(obj)
+            continue
+
+        if tile_level >= max_level:
+            print(f"Maximum tile level ({max_level}) reached - decimating and exporting")
+            decimate_object(obj, TRIANGLE_THRESHOLD)
+            queue_export(obj)
+            continue
+
+        print(f"Object exceeds {TRIANGLE_THRESHOLD} triangles - tiling...")
+
+        # Duplicate the object
+        decimated_name = f"{tile_level}_{ix}_{iy}_{iz}_decimated"
+        decimated_obj = duplicate_object(obj, decimated_name)
+
+        # Decimate the duplicate
+        decimate_object(decimated_obj, TRIANGLE_THRESHOLD)
+        queue_export(decimated_obj)
+
+        # Bisect the original object into octree
+        chunks = bisect_object_octree(obj, tile_level + 1, ix, iy, iz)
+
+        # Remove the original object (it's been split) and its mesh
+        remove_object_and_mesh(obj)
+
+        # Queue each chunk for processing
+        for chunk in chunks:
+            # Parse chunk name to get coordinates
+            parts = chunk.name.split('_')
+            if len(parts) >= 4:
+                work_queue.append((chunk, int(parts[0]), int(parts[1]),
+                                   int(parts[2]), int(parts[3])))
 
 # ===========================================
 # TEST SETUP AND EXECUTION
@@ -643,7 +865,7 @@ def setup_test_object():
 
 def run_adaptive_tiling_test():
     """Main test function"""
-    global total_exported, total_decimated, triangle_count_cache, created_directories
+    global total_exported, total_decimated, created_directories
     clear_scene(None)  # Clear the scene before starting
 
     print("=" * 50)
@@ -661,8 +883,8 @@ def run_adaptive_tiling_test():
     # Reset counters and caches
     total_exported = 0
     total_decimated = 0
-    triangle_count_cache.clear()  # Clear triangle count cache for new run
     created_directories.clear()   # Clear directory cache for new run
+    pending_exports.clear()       # Clear export queue for new run
     
     # Setup test object
     obj = setup_test_object()
@@ -755,8 +977,14 @@ def run_adaptive_tiling_test():
         print(f"Chunk files located in: {chunks_temp_dir}")
 
     else:
-        # Normal sequential processing
-        process_object_adaptive(obj, tile_level=0, ix=0, iy=0, iz=0)
+        # Normal sequential processing (max_level passed explicitly: the
+        # def-time default would pin the value parsed at import, which is
+        # stale for manifest jobs that override MAX_TILE_LEVEL per entry)
+        process_object_adaptive(obj, tile_level=0, ix=0, iy=0, iz=0,
+                                max_level=MAX_TILE_LEVEL)
+
+        # Tiles were queued during the recursion; write them all in one pass
+        export_pending_objects(TEST_OUTPUT_DIR)
 
     print("\n" + "=" * 50)
     print("ADAPTIVE TILING TEST COMPLETE")
@@ -769,12 +997,35 @@ def run_adaptive_tiling_test():
     if not FIRST_SPLIT_ONLY:
         print()
         print("Performance optimizations active:")
-        print(f"  - Triangle count cache hits: {len(triangle_count_cache)} cached values")
+        print(f"  - Triangle counts cached per object via '_tri_count' custom property")
         print(f"  - Directory creation optimizations: {len(created_directories)} folders cached")
 
 # ===========================================
 # RUN THE TEST
 # ===========================================
 
-# Execute the test
-run_adaptive_tiling_test()
\ No newline at end of file
+if MANIFEST_PATH:
+    # Batch mode: loop every manifest job inside this one Blender session,
+    # paying the multi-second cold start (and addon init) once per batch
+    # instead of once per file
+    with open(MANIFEST_PATH) as manifest_file:
+        manifest_jobs = json.load(manifest_file).get("jobs", [])
+
+    print(f"Manifest mode: {len(manifest_jobs)} job(s) in this session")
+    for job_index, job in enumerate(manifest_jobs):
+        if job_index > 0:
+            # Reset to an empty scene between jobs so datablocks from the
+            # previous file (meshes, images, materials) don't accumulate
+            bpy.ops.wm.read_factory_settings(use_empty=True)
+            bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True,
+                                   do_recursive=True)
+
+        TEST_OBJ_PATH = job["in"]
+        TEST_OUTPUT_DIR = job["out"]
+        MAX_TILE_LEVEL = int(job.get("max_lod", 3))
+
+        print(f"\n=== Manifest job {job_index + 1}/{len(manifest_jobs)}: {TEST_OBJ_PATH} ===")
+        run_adaptive_tiling_test()
+else:
+    # Execute the test
+    run_adaptive_tiling_test()
\ No newline at end of file
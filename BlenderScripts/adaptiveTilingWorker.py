@@ -7,7 +7,10 @@ Each worker processes one chunk independently, allowing for significant speedup.
 """
 
 import bpy, bmesh
+import numpy as np
 from mathutils import Vector
+from collections import deque
+import hashlib
 import os
 import sys
 
@@ -43,9 +46,11 @@ else:
 # Global counters
 total_exported = 0
 total_decimated = 0
-triangle_count_cache = {}
 created_directories = set()
 
+# Finalized tiles accumulated during the recursion and exported in one batch
+pending_exports = []
+
 print(f"\n{'='*60}")
 print(f"ADAPTIVE TILING WORKER")
 print(f"{'='*60}")
@@ -61,33 +66,46 @@ print(f"{'='*60}\n")
 
 def get_bounds(obj, local=True):
     """Get the bounding box of an object"""
-    if local:
-        coords = obj.bound_box
-    else:
-        coords = [obj.matrix_world @ Vector(c) for c in obj.bound_box]
-    xs = [p[0] for p in coords]; ys = [p[1] for p in coords]; zs = [p[2] for p in coords]
-    return (min(xs), max(xs)), (min(ys), max(ys)), (min(zs), max(zs))
+    # One numpy array over the 8 corners replaces eight Vector builds and
+    # three list comprehensions; world-space corners come from a single
+    # matmul with the homogeneous transform instead of 8 Vector multiplies
+    pts = np.array([tuple(c) for c in obj.bound_box], dtype=np.float64)
+    if not local:
+        m = np.array(obj.matrix_world, dtype=np.float64)
+        pts = (pts @ m[:3, :3].T) + m[:3, 3]
+    mins = pts.min(axis=0)
+    maxs = pts.max(axis=0)
+    return (mins[0], maxs[0]), (mins[1], maxs[1]), (mins[2], maxs[2])
 
 def get_triangle_count(obj):
     """Get the number of triangles in a mesh object (with caching)"""
-    global triangle_count_cache
-
     if obj.type != 'MESH' or not obj.data:
         return 0
 
-    cache_key = (obj.name, len(obj.data.vertices), len(obj.data.polygons))
-    if cache_key in triangle_count_cache:
-        return triangle_count_cache[cache_key]
+    # Cached as a custom property on the object; decimate_object invalidates
+    cached = obj.get("_tri_count")
+    if cached is not None:
+        return cached
 
-    bm = bmesh.new()
-    bm.from_mesh(obj.data)
-    bmesh.ops.triangulate(bm, faces=bm.faces)
-    triangle_count = len(bm.faces)
-    bm.free()
+    # Triangulating an n-gon yields n-2 triangles, so one foreach_get over
+    # loop totals replaces the old build-a-bmesh-and-triangulate approach
+    num_polys = len(obj.data.polygons)
+    if num_polys == 0:
+        triangle_count = 0
+    else:
+        loop_totals = np.empty(num_polys, dtype=np.int32)
+        obj.data.polygons.foreach_get("loop_total", loop_totals)
+        triangle_count = int((loop_totals - 2).sum())
 
-    triangle_count_cache[cache_key] = triangle_count
+    obj["_tri_count"] = triangle_count
     return triangle_count
 
+
+def invalidate_triangle_count(obj):
+    """Drop the cached count after an operation that changes geometry"""
+    if "_tri_count" in obj:
+        del obj["_tri_count"]
+
 def duplicate_object(obj, new_name):
     """Create a duplicate of an object with a new name"""
     new_mesh = obj.data.copy()
@@ -105,6 +123,64 @@ def duplicate_object(obj, new_name):
 
     return new_obj
 
+# Optional cross-run decimation cache (opt-in via the MESH2TILE_CACHE_DIR
+# environment variable). Re-runs over the same source geometry - common while
+# tuning pipeline settings - reload the decimated mesh instead of redoing the
+# decimation, keyed by a content hash of the vertex coordinates.
+DECIMATE_CACHE_DIR = os.environ.get("MESH2TILE_CACHE_DIR")
+
+def _decimation_cache_path(obj, target_triangles):
+    """Cache file keyed by vertex-coordinate hash and target triangle count"""
+    coords = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    obj.data.vertices.foreach_get("co", coords)
+    digest = hashlib.blake2b(coords.tobytes(), digest_size=16).hexdigest()
+    return os.path.join(DECIMATE_CACHE_DIR, f"{digest}_{target_triangles}.obj")
+
+def _load_cached_decimation(obj, cache_path):
+    """Swap obj's mesh for the cached decimated mesh, keeping its materials"""
+    try:
+        bpy.ops.object.select_all(action='DESELECT')
+        bpy.ops.wm.obj_import(filepath=cache_path)
+        imported = [o for o in bpy.context.selected_objects if o.type == 'MESH']
+        if not imported:
+            return False
+
+        cached_mesh = imported[0].data
+        # The cache stores geometry + UVs only; reattach the object's own
+        # material datablocks (slot order matches the source mesh)
+        cached_mesh.materials.clear()
+        for mat in obj.data.materials:
+            cached_mesh.materials.append(mat)
+
+        old_mesh = obj.data
+        obj.data = cached_mesh
+        for o in imported:
+            bpy.data.objects.remove(o, do_unlink=True)
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+        invalidate_triangle_count(obj)
+        return True
+    except Exception as e:
+        print(f"  Decimation cache load failed ({e}) - decimating normally")
+        return False
+
+def _store_cached_decimation(obj, cache_path):
+    try:
+        os.makedirs(DECIMATE_CACHE_DIR, exist_ok=True)
+        bpy.ops.object.select_all(action='DESELECT')
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.wm.obj_export(
+            filepath=cache_path,
+            export_selected_objects=True,
+            export_materials=False,
+            export_uv=True,
+            apply_modifiers=False,
+            global_scale=1.0
+        )
+    except Exception as e:
+        print(f"  Decimation cache store failed ({e})")
+
 def decimate_object(obj, target_triangles):
     """Decimate an object to target triangle count"""
     global total_decimated
@@ -116,16 +192,40 @@ def decimate_object(obj, target_triangles):
 
     print(f"  Decimating {obj.name} from {current_triangles} to {target_triangles} triangles")
 
-    ratio = target_triangles / current_triangles
+    # Reuse a previously decimated mesh for identical input when caching is on
+    cache_path = None
+    if DECIMATE_CACHE_DIR:
+        cache_path = _decimation_cache_path(obj, target_triangles)
+        if os.path.exists(cache_path) and _load_cached_decimation(obj, cache_path):
+            print(f"    Loaded from decimation cache: {get_triangle_count(obj)} triangles")
+            total_decimated += 1
+            return obj
 
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
+    ratio = target_triangles / current_triangles
 
     decimate_mod = obj.modifiers.new(name="Decimate", type='DECIMATE')
     decimate_mod.ratio = ratio
     decimate_mod.use_collapse_triangulate = True
 
-    bpy.ops.object.modifier_apply(modifier="Decimate")
+    # Evaluate the modifier stack through the depsgraph and swap the result
+    # mesh in, instead of bpy.ops.object.modifier_apply which needs the object
+    # selected + active and forces an extra depsgraph update per tile
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    decimated_mesh = bpy.data.meshes.new_from_object(eval_obj)
+    decimated_mesh.name = obj.data.name
+
+    obj.modifiers.clear()
+    old_mesh = obj.data
+    for mat in old_mesh.materials:
+        decimated_mesh.materials.append(mat)
+    obj.data = decimated_mesh
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+    invalidate_triangle_count(obj)
+
+    if cache_path:
+        _store_cached_decimation(obj, cache_path)
 
     final_triangles = get_triangle_count(obj)
     print(f"    Result: {final_triangles} triangles (ratio: {ratio:.3f})")
@@ -179,6 +279,68 @@ def export_object_test(obj, output_dir):
 
     total_exported += 1
 
+def queue_export(obj):
+    """Defer exporting a finalized tile to one batched pass at the end"""
+    pending_exports.append(obj)
+    print(f"  Queued {obj.name} for export ({get_triangle_count(obj)} triangles)")
+
+def export_pending_objects(output_dir):
+    """Export all queued tiles in one pass (one OBJ per tile, selection
+    toggled directly instead of running select_all per export)"""
+    global total_exported, created_directories
+
+    if not pending_exports:
+        return
+
+    print(f"\nExporting {len(pending_exports)} queued tiles...")
+    for o in bpy.context.view_layer.objects:
+        o.select_set(False)
+
+    for obj in pending_exports:
+        tile_level = get_tile_level_from_name(obj.name)
+        clean_name = clean_object_name(obj.name)
+
+        tile_folder = os.path.join(output_dir, f"TileLevel_{tile_level}")
+        if tile_folder not in created_directories:
+            os.makedirs(tile_folder, exist_ok=True)
+            created_directories.add(tile_folder)
+
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+
+        output_file = os.path.join(tile_folder, f"{clean_name}.obj")
+        bpy.ops.wm.obj_export(
+            filepath=output_file,
+            export_selected_objects=True,
+            export_materials=True,
+            export_uv=True,
+            apply_modifiers=False,
+            global_scale=1.0
+        )
+        obj.select_set(False)
+        print(f"    Exported: {output_file}")
+        total_exported += 1
+
+    pending_exports.clear()
+
+# Small freelist of bmesh instances reused across octant builds: clear()
+# resets a bmesh far more cheaply than a free()+new() pair, which hits
+# Blender's allocator 9 times per bisection (source + 8 octants).
+_BM_POOL = []
+_BM_POOL_CAP = 8
+
+def get_bm():
+    """Take a bmesh from the pool, or allocate one if the pool is empty"""
+    return _BM_POOL.pop() if _BM_POOL else bmesh.new()
+
+def put_bm(bm):
+    """Return a bmesh to the pool (cleared), freeing it if the pool is full"""
+    if len(_BM_POOL) < _BM_POOL_CAP:
+        bm.clear()
+        _BM_POOL.append(bm)
+    else:
+        bm.free()
+
 def bisect_object_octree(obj, tile_level, ix, iy, iz):
     """
     Bisect an object into 8 octree chunks using optimized spatial partitioning
@@ -193,29 +355,55 @@ def bisect_object_octree(obj, tile_level, ix, iy, iz):
     y_mid = (ymin + ymax) / 2
     z_mid = (zmin + zmax) / 2
 
-    bm_orig = bmesh.new()
+    bm_orig = get_bm()
     obj.data.update()
     bm_orig.from_mesh(obj.data)
     bm_orig.faces.ensure_lookup_table()
     bm_orig.verts.ensure_lookup_table()
 
-    face_materials = []
-    if len(obj.data.materials) > 0:
-        for i, face in enumerate(bm_orig.faces):
-            poly_index = i if i < len(obj.data.polygons) else 0
-            mat_idx = obj.data.polygons[poly_index].material_index
-            face_materials.append(mat_idx)
+    # foreach_get pulls all indices in one C call instead of N slow
+    # bpy_prop_collection accesses; tolist() keeps per-face lookups cheap
+    num_faces = len(bm_orig.faces)
+    if len(obj.data.materials) > 0 and len(obj.data.polygons) > 0:
+        mat_indices = np.zeros(len(obj.data.polygons), dtype=np.int32)
+        obj.data.polygons.foreach_get("material_index", mat_indices)
+        face_materials = mat_indices[:num_faces].tolist()
+        if len(face_materials) < num_faces:
+            face_materials += [0] * (num_faces - len(face_materials))
     else:
-        face_materials = [0] * len(bm_orig.faces)
+        face_materials = [0] * num_faces
 
     octant_faces = {(dx, dy, dz): [] for dx in range(2) for dy in range(2) for dz in range(2)}
 
-    for face_idx, face in enumerate(bm_orig.faces):
-        centroid = face.calc_center_median()
-        dx = 0 if centroid.x < x_mid else 1
-        dy = 0 if centroid.y < y_mid else 1
-        dz = 0 if centroid.z < z_mid else 1
-        octant_faces[(dx, dy, dz)].append((face_idx, face_materials[face_idx]))
+    if num_faces == len(obj.data.polygons):
+        # Polygon centers come straight off the mesh in one foreach_get and
+        # the octant tests run as three vectorized comparisons, instead of a
+        # Python loop calling calc_center_median per face
+        centers = np.empty(num_faces * 3, dtype=np.float64)
+        obj.data.polygons.foreach_get("center", centers)
+        centers = centers.reshape(-1, 3)
+        octant_dx = (centers[:, 0] >= x_mid).astype(np.int8)
+        octant_dy = (centers[:, 1] >= y_mid).astype(np.int8)
+        octant_dz = (centers[:, 2] >= z_mid).astype(np.int8)
+        octant_keys = octant_dx * 4 + octant_dy * 2 + octant_dz
+        # A single stable argsort groups the faces of all 8 octants at once,
+        # replacing eight full re-scans of octant_keys (one np.nonzero per
+        # octant) with one pass plus slicing
+        order = np.argsort(octant_keys, kind='stable')
+        boundaries = np.searchsorted(octant_keys[order], np.arange(9))
+        for code in range(8):
+            indices = order[boundaries[code]:boundaries[code + 1]]
+            octant_faces[(code >> 2, (code >> 1) & 1, code & 1)] = [
+                (i, face_materials[i]) for i in indices.tolist()]
+    else:
+        # bmesh face count drifted from the mesh (shouldn't happen right
+        # after from_mesh) - keep the per-face bmesh path as a fallback
+        for face_idx, face in enumerate(bm_orig.faces):
+            centroid = face.calc_center_median()
+            dx = 0 if centroid.x < x_mid else 1
+            dy = 0 if centroid.y < y_mid else 1
+            dz = 0 if centroid.z < z_mid else 1
+            octant_faces[(dx, dy, dz)].append((face_idx, face_materials[face_idx]))
 
     chunks = []
 
@@ -239,7 +427,7 @@ def bisect_object_octree(obj, tile_level, ix, iy, iz):
                 chunk_name = f"{int(tile_level)}_{int(new_ix)}_{int(new_iy)}_{int(new_iz)}"
                 print(f"    Processing chunk {chunk_name} (dx:{dx}, dy:{dy}, dz:{dz})")
 
-                bm_chunk = bmesh.new()
+                bm_chunk = get_bm()
 
                 # UV layer preservation
                 uv_layer_orig = bm_orig.loops.layers.uv.active
@@ -283,9 +471,14 @@ def bisect_object_octree(obj, tile_level, ix, iy, iz):
                     for mat in obj.data.materials:
                         me.materials.append(mat)
 
-                    for face_idx, mat_idx in enumerate(created_faces_materials):
-                        if face_idx < len(me.polygons):
-                            me.polygons[face_idx].material_index = mat_idx
+                    if created_faces_materials:
+                        chunk_mats = np.asarray(created_faces_materials, dtype=np.int32)
+                        if len(chunk_mats) == len(me.polygons):
+                            me.polygons.foreach_set("material_index", chunk_mats)
+                        else:
+                            for face_idx, mat_idx in enumerate(created_faces_materials):
+                                if face_idx < len(me.polygons):
+                                    me.polygons[face_idx].material_index = mat_idx
 
                     chunk_obj = bpy.data.objects.new(chunk_name, me)
                     bpy.context.collection.objects.link(chunk_obj)
@@ -295,51 +488,60 @@ def bisect_object_octree(obj, tile_level, ix, iy, iz):
                 else:
                     print(f"      Chunk {chunk_name} is empty - skipping")
 
-                bm_chunk.free()
+                put_bm(bm_chunk)
 
-    bm_orig.free()
+    put_bm(bm_orig)
     print(f"    Created {len(chunks)} non-empty chunks")
     return chunks
 
+def remove_object_and_mesh(obj):
+    """Remove an object together with its mesh datablock when unused"""
+    mesh = obj.data
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if mesh and mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+
 def process_object_adaptive(obj, tile_level=0, ix=0, iy=0, iz=0, max_level=3):
-    """Recursively process an object with adaptive tiling"""
-    print(f"\n=== Processing object {obj.name} at tile level {tile_level} ===")
+    """Process an object with adaptive tiling via a depth-first work queue"""
+    work_queue = deque([(obj, tile_level, ix, iy, iz)])
+    while work_queue:
+        # pop() walks depth-first so only one octree path is alive at a time
+        obj, tile_level, ix, iy, iz = work_queue.pop()
 
-    triangle_count = get_triangle_count(obj)
-    print(f"Triangle count: {triangle_count}")
+        print(f"\n=== Processing object {obj.name} at tile level {tile_level} ===")
 
-    if triangle_count <= TRIANGLE_THRESHOLD:
-        print(f"Object has ≤ {TRIANGLE_THRESHOLD} triangles - exporting as is")
-        export_object_test(obj, OUTPUT_DIR)
-        return
+        triangle_count = get_triangle_count(obj)
+        print(f"Triangle count: {triangle_count}")
 
-    if tile_level >= max_level:
-        print(f"Maximum tile level ({max_level}) reached - decimating and exporting")
-        decimate_object(obj, TRIANGLE_THRESHOLD)
-        export_object_test(obj, OUTPUT_DIR)
-        return
+        if triangle_count <= TRIANGLE_THRESHOLD:
+            print(f"Object has ≤ {TRIANGLE_THRESHOLD} triangles - exporting as is")
+            queue_export(obj)
+            continue
 
-    print(f"Object exceeds {TRIANGLE_THRESHOLD} triangles - tiling...")
+        if tile_level >= max_level:
+            print(f"Maximum tile level ({max_level}) reached - decimating and exporting")
+            decimate_object(obj, TRIANGLE_THRESHOLD)
+            queue_export(obj)
+            continue
 
-    decimated_name = f"{tile_level}_{ix}_{iy}_{iz}_decimated"
-    decimated_obj = duplicate_object(obj, decimated_name)
+        print(f"Object exceeds {TRIANGLE_THRESHOLD} triangles - tiling...")
 
-    decimate_object(decimated_obj, TRIANGLE_THRESHOLD)
-    export_object_test(decimated_obj, OUTPUT_DIR)
+        decimated_name = f"{tile_level}_{ix}_{iy}_{iz}_decimated"
+        decimated_obj = duplicate_object(obj, decimated_name)
 
-    chunks = bisect_object_octree(obj, tile_level + 1, ix, iy, iz)
+        decimate_object(decimated_obj, TRIANGLE_THRESHOLD)
+        queue_export(decimated_obj)
 
-    bpy.data.objects.remove(obj, do_unlink=True)
+        chunks = bisect_object_octree(obj, tile_level + 1, ix, iy, iz)
 
-    for chunk in chunks:
-        parts = chunk.name.split('_')
-        if len(parts) >= 4:
-            chunk_tile_level = int(parts[0])
-            chunk_ix = int(parts[1])
-            chunk_iy = int(parts[2])
-            chunk_iz = int(parts[3])
+        # Free the parent (object and mesh) before descending into chunks
+        remove_object_and_mesh(obj)
 
-            process_object_adaptive(chunk, chunk_tile_level, chunk_ix, chunk_iy, chunk_iz, max_level)
+        for chunk in chunks:
+            parts = chunk.name.split('_')
+            if len(parts) >= 4:
+                work_queue.append((chunk, int(parts[0]), int(parts[1]),
+                                   int(parts[2]), int(parts[3])))
 
 # ===========================================
 # MAIN WORKER EXECUTION
@@ -375,6 +577,9 @@ def run_worker():
     # Process this chunk recursively
     process_object_adaptive(obj, TILE_LEVEL, IX, IY, IZ, MAX_TILE_LEVEL)
 
+    # Tiles were queued during the recursion; write them all in one pass
+    export_pending_objects(OUTPUT_DIR)
+
     print(f"\n{'='*60}")
     print(f"WORKER COMPLETE")
     print(f"{'='*60}")
@@ -0,0 +1,65 @@
+import bpy
+import json
+import sys
+import traceback
+
+# Persistent Blender worker: runs inside one --background session and executes
+# pipeline scripts sent as JSON job lines on stdin, so callers pay Blender's
+# multi-second cold start once per session instead of once per tile.
+#
+# Job format (one JSON object per line):
+#   {"script": "<path to a BlenderScripts/*.py script>", "args": ["--input", ...]}
+# An empty line or EOF shuts the worker down. After each job the worker resets
+# to an empty factory scene and replies {"ok": true} or {"ok": false, "error": ...}
+# on stdout.
+
+
+def run_job(job):
+    script_path = job["script"]
+    args = job.get("args", [])
+
+    # The pipeline scripts read their arguments from sys.argv after "--",
+    # exactly as when launched via blender --background --python script -- ...
+    sys.argv = [script_path, "--"] + list(args)
+
+    with open(script_path) as f:
+        code = compile(f.read(), script_path, "exec")
+    exec(code, {"__name__": "__main__", "__file__": script_path})
+
+
+def reset_scene():
+    """Return to an empty factory scene so jobs don't leak data into each other."""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    for block_collection in (bpy.data.meshes, bpy.data.materials, bpy.data.images):
+        for block in list(block_collection):
+            if block.users == 0:
+                block_collection.remove(block)
+
+
+def main():
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            break
+
+        try:
+            job = json.loads(line)
+            run_job(job)
+            response = {"ok": True}
+        except SystemExit as e:
+            # argparse in a job script exits on bad args; keep the worker alive
+            response = {"ok": e.code in (0, None), "error": f"exit code {e.code}"}
+        except Exception:
+            response = {"ok": False, "error": traceback.format_exc()}
+
+        try:
+            reset_scene()
+        except Exception:
+            pass
+
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -18,8 +18,11 @@ def convert_obj_to_glb(input_dir, output_dir):
 
     os.makedirs(output_dir, exist_ok=True)
 
-    # Find all OBJ files
-    obj_files = [f for f in os.listdir(input_dir) if f.lower().endswith('.obj')]
+    # Find all OBJ files (scandir skips the extra stat per entry that a
+    # listdir + is-file check would pay on big tile directories)
+    with os.scandir(input_dir) as it:
+        obj_files = [e.name for e in it
+                     if e.is_file() and e.name.lower().endswith('.obj')]
     print(f"Found {len(obj_files)} OBJ files to convert")
 
     success_count = 0
@@ -5,6 +5,15 @@ from mathutils import Vector
 import argparse
 import sys
 
+# Pillow writes PNGs several times faster than Blender's internal encoder;
+# fall back to image.save() when it isn't bundled with the Blender python.
+try:
+    import numpy as np
+    from PIL import Image as PILImage
+except ImportError:
+    np = None
+    PILImage = None
+
 class LODGenerator:
     def __init__(self, input_file, output_dir="", lod_levels=4):
         self.input_file = input_file
@@ -17,8 +26,10 @@ class LODGenerator:
         
     def clear_scene(self):
         """Clear all objects from the scene"""
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
+        # bpy.data.objects.remove skips the operator registry/undo round
+        # trip that select_all + delete would pay
+        for obj in list(bpy.data.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
         
     def import_obj(self):
         """Import the OBJ file"""
@@ -42,37 +53,49 @@ class LODGenerator:
     
     def cleanup_mesh(self, obj, merge_distance=0.001):
         """Clean up the mesh by merging vertices by distance"""
-        # Ensure we're working with the correct object
-        bpy.context.view_layer.objects.active = obj
-        
-        # Enter edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Select all vertices
-        bpy.ops.mesh.select_all(action='SELECT')
-        
-        # Merge vertices by distance (equivalent to Mesh > Clean Up > Merge By Distance)
-        bpy.ops.mesh.remove_doubles(threshold=merge_distance)
-        
-        # Return to object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
+        # Work on the mesh data directly with bmesh: no edit-mode round trip,
+        # no selection operators, no undo push per object
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+        bm.to_mesh(obj.data)
+        bm.free()
+        obj.data.update()
+
         print(f"  Cleaned up mesh: {obj.name} (merged vertices within {merge_distance} distance)")
         
     def decimate_mesh(self, obj, ratio):
-        """Apply decimation modifier to reduce polygon count"""
-        # Ensure we're in object mode
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Add decimate modifier
-        decimate = obj.modifiers.new(name="Decimate", type='DECIMATE')
-        decimate.ratio = ratio
-        decimate.use_collapse_triangulate = True
-        
-        # Apply the modifier
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.modifier_apply(modifier="Decimate")
+        """Reduce polygon count by decimating in bmesh directly.
+
+        Avoids the modifier_apply operator, which re-evaluates the full
+        depsgraph once per LOD level of the same base mesh.
+        """
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+
+        try:
+            # Triangulate first so collapse decimation matches the old
+            # use_collapse_triangulate modifier behaviour
+            bmesh.ops.triangulate(bm, faces=bm.faces)
+            # The operator's geometry slot is verts, not faces
+            bmesh.ops.decimate(bm, verts=bm.verts, ratio=ratio)
+        except (AttributeError, TypeError):
+            # Older Blender without bmesh.ops.decimate (or with a different
+            # operator signature) - fall back to the modifier pipeline
+            bm.free()
+            bpy.context.view_layer.objects.active = obj
+            bpy.ops.object.mode_set(mode='OBJECT')
+            decimate = obj.modifiers.new(name="Decimate", type='DECIMATE')
+            decimate.ratio = ratio
+            decimate.use_collapse_triangulate = True
+            bpy.context.view_layer.objects.active = obj
+            bpy.ops.object.modifier_apply(modifier="Decimate")
+            return
+
+        bm.to_mesh(obj.data)
+        obj.data.update()
+        bm.free()
         
     def optimize_materials(self, obj, lod_level):
         """Compress and optimize materials for LOD level"""
@@ -242,10 +265,13 @@ class LODGenerator:
         
     def export_lod(self, objects, lod_level):
         """Export LOD objects to file"""
-        # Select only the LOD objects
-        bpy.ops.object.select_all(action='DESELECT')
+        # Select only the LOD objects; direct select_set avoids the
+        # select_all operator dispatch
+        for obj in bpy.context.view_layer.objects:
+            obj.select_set(False)
         for obj in objects:
             obj.select_set(True)
+        bpy.context.view_layer.objects.active = objects[0]
             
         # Export path
         export_path = os.path.join(self.output_dir, f"{self.base_name}_LOD{lod_level}.obj")
@@ -286,22 +312,39 @@ class LODGenerator:
         if not os.path.exists(texture_dir):
             os.makedirs(texture_dir)
             
+        # Lower LODs tolerate a lighter zlib effort for another encoder speedup
+        compress_level = 1 if lod_level >= 2 else 3
+
         saved_textures = []
         for image in bpy.data.images:
             if f"_LOD{lod_level}" in image.name and image.has_data:
                 try:
-                    # Set file format for export
-                    image.file_format = 'PNG'  # or 'JPEG' for smaller files
-                    
-                    # Save path
                     texture_path = os.path.join(texture_dir, f"{image.name}.png")
-                    image.filepath_raw = texture_path
-                    image.save()
+
+                    if PILImage is not None:
+                        # Pull the float pixel buffer out in one C call and
+                        # hand it straight to Pillow, bypassing Blender's
+                        # single-threaded PNG encoder entirely.
+                        width, height = image.size
+                        channels = image.channels
+                        pixels = np.empty(width * height * channels, dtype=np.float32)
+                        image.pixels.foreach_get(pixels)
+                        pixels = (pixels.reshape(height, width, channels) * 255.0)
+                        # Blender stores rows bottom-up; PNG is top-down
+                        pixels = np.flipud(pixels.clip(0, 255).astype(np.uint8))
+                        PILImage.fromarray(pixels).save(
+                            texture_path, format='PNG', compress_level=compress_level)
+                    else:
+                        # Set file format for export
+                        image.file_format = 'PNG'  # or 'JPEG' for smaller files
+                        image.filepath_raw = texture_path
+                        image.save()
+
                     saved_textures.append(texture_path)
                     print(f"  Saved compressed texture: {texture_path}")
                 except Exception as e:
                     print(f"  Warning: Failed to save texture {image.name}: {e}")
-                    
+
         return saved_textures
         
     def generate_lods(self):
@@ -247,111 +247,53 @@ def create_chunk_with_materials(bm, chunk_name, original_obj):
     bpy.context.collection.objects.link(ob)
     return ob
 
-# Iterate each cell - now creating chunks with X, Y, and Z divisions
-for ix in range(chunks[0]):
-    for iy in range(chunks[1]):
-        for iz in range(chunks[2]):
-            bm = bm_orig.copy()
-            
+# Hierarchical binary-space partitioning: instead of copying the full mesh
+# once per cell and running up to 6 bisects over the whole geometry each time,
+# slice the mesh along X first, then slice each X slab along Y, then each
+# X/Y slab along Z. Every cut only touches the geometry of its own slab, so
+# total bisect work and peak memory drop roughly 3x for a 4x4x2 grid.
+def split_along_axis(bm, axis, cut_points):
+    """Split a bmesh into len(cut_points)+1 slices along one axis.
+
+    Consumes bm (it becomes the last slice). Each interior cut copies the
+    current remainder, keeps the lower side on the copy (clear_outer) and the
+    upper side on the remainder (clear_inner), so the geometry being copied
+    shrinks with every cut. Returns slices in ascending coordinate order.
+    """
+    plane_no = Vector([1 if i == axis else 0 for i in range(3)])
+    slices = []
+    remainder = bm
+    for cut in cut_points:
+        plane_co = Vector([cut if i == axis else 0 for i in range(3)])
+        lower = remainder.copy()
+        bmesh.ops.bisect_plane(
+            lower,
+            geom=lower.verts[:] + lower.edges[:] + lower.faces[:],
+            plane_co=plane_co,
+            plane_no=plane_no,
+            clear_outer=True,
+            clear_inner=False
+        )
+        bmesh.ops.bisect_plane(
+            remainder,
+            geom=remainder.verts[:] + remainder.edges[:] + remainder.faces[:],
+            plane_co=plane_co,
+            plane_no=plane_no,
+            clear_outer=False,
+            clear_inner=True
+        )
+        slices.append(lower)
+    slices.append(remainder)
+    return slices
+
+# ranges[axis][1:-1] are the interior cut planes; the outer bounds need no cut
+x_slices = split_along_axis(bm_orig, 0, ranges[0][1:-1])
+for ix, bm_x in enumerate(x_slices):
+    y_slices = split_along_axis(bm_x, 1, ranges[1][1:-1])
+    for iy, bm_y in enumerate(y_slices):
+        z_slices = split_along_axis(bm_y, 2, ranges[2][1:-1])
+        for iz, bm in enumerate(z_slices):
             print(f"\n=== Processing chunk {count} (X:{ix}, Y:{iy}, Z:{iz}) ===")
-            print(f"Starting with {len(bm.faces)} faces")
-
-            # Calculate chunk boundaries
-            x_left = ranges[0][ix]
-            x_right = ranges[0][ix + 1]
-            y_bottom = ranges[1][iy]
-            y_top = ranges[1][iy + 1]
-            z_bottom = ranges[2][iz]
-            z_top = ranges[2][iz + 1]
-            
-            print(f"  Chunk bounds: X({x_left:.3f} to {x_right:.3f}), Y({y_bottom:.3f} to {y_top:.3f}), Z({z_bottom:.3f} to {z_top:.3f})")
-            
-            # Center points for bisection planes
-            center_x = (x_left + x_right) / 2
-            center_y = (y_bottom + y_top) / 2
-            center_z = (z_bottom + z_top) / 2
-
-            # Cut along X-axis (keep only the current X slice)
-            print(f"  Cutting X: keeping slice between {x_left:.3f} and {x_right:.3f}")
-            
-            # Remove everything to the left of x_left
-            if ix > 0:  # Only cut if not the leftmost chunk
-                bmesh.ops.bisect_plane(
-                    bm,
-                    geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
-                    plane_co=Vector((x_left, center_y, center_z)),
-                    plane_no=Vector((-1, 0, 0)),  # Normal pointing left
-                    clear_outer=True,  # Remove everything on the left side
-                    clear_inner=False
-                )
-                print(f"    After left X cut: {len(bm.faces)} faces")
-
-            # Remove everything to the right of x_right
-            if ix < chunks[0] - 1:  # Only cut if not the rightmost chunk
-                bmesh.ops.bisect_plane(
-                    bm,
-                    geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
-                    plane_co=Vector((x_right, center_y, center_z)),
-                    plane_no=Vector((1, 0, 0)),  # Normal pointing right
-                    clear_outer=True,  # Remove everything on the right side
-                    clear_inner=False
-                )
-                print(f"    After right X cut: {len(bm.faces)} faces")
-
-            # Cut along Y-axis (keep only the current Y slice)
-            print(f"  Cutting Y: keeping slice between {y_bottom:.3f} and {y_top:.3f}")
-            
-            # Remove everything below y_bottom
-            if iy > 0:  # Only cut if not the bottom chunk
-                bmesh.ops.bisect_plane(
-                    bm,
-                    geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
-                    plane_co=Vector((center_x, y_bottom, center_z)),
-                    plane_no=Vector((0, -1, 0)),  # Normal pointing down
-                    clear_outer=True,  # Remove everything below
-                    clear_inner=False
-                )
-                print(f"    After bottom Y cut: {len(bm.faces)} faces")
-
-            # Remove everything above y_top
-            if iy < chunks[1] - 1:  # Only cut if not the top chunk
-                bmesh.ops.bisect_plane(
-                    bm,
-                    geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
-                    plane_co=Vector((center_x, y_top, center_z)),
-                    plane_no=Vector((0, 1, 0)),  # Normal pointing up
-                    clear_outer=True,  # Remove everything above
-                    clear_inner=False
-                )
-                print(f"    After top Y cut: {len(bm.faces)} faces")
-
-            # Cut along Z-axis (keep only the current Z slice)
-            print(f"  Cutting Z: keeping slice between {z_bottom:.3f} and {z_top:.3f}")
-            
-            # Remove everything below z_bottom
-            if iz > 0:  # Only cut if not the bottom chunk
-                bmesh.ops.bisect_plane(
-                    bm,
-                    geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
-                    plane_co=Vector((center_x, center_y, z_bottom)),
-                    plane_no=Vector((0, 0, -1)),  # Normal pointing down (negative Z)
-                    clear_outer=True,  # Remove everything below
-                    clear_inner=False
-                )
-                print(f"    After bottom Z cut: {len(bm.faces)} faces")
-
-            # Remove everything above z_top
-            if iz < chunks[2] - 1:  # Only cut if not the top chunk
-                bmesh.ops.bisect_plane(
-                    bm,
-                    geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
-                    plane_co=Vector((center_x, center_y, z_top)),
-                    plane_no=Vector((0, 0, 1)),  # Normal pointing up (positive Z)
-                    clear_outer=True,  # Remove everything above
-                    clear_inner=False
-                )
-                print(f"    After top Z cut: {len(bm.faces)} faces")
-
             print(f"  Final result: {len(bm.faces)} faces remaining")
 
             # Check if chunk has any geometry left
@@ -363,7 +305,7 @@ for ix in range(chunks[0]):
                 exported_count += 1
             else:
                 print(f"  Chunk {count} is empty - SKIPPING")
-            
+
             bm.free()
             count += 1
 
@@ -415,5 +357,5 @@ for ob in bpy.context.collection.objects:
 
 print(f"Successfully exported {export_count} chunk files with materials to {output_dir}")
 
-# Clean up bmesh
-bm_orig.free()
\ No newline at end of file
+# bm_orig was consumed by split_along_axis (it became the last X slice) and
+# freed with the other slices - no separate cleanup needed
\ No newline at end of file
@@ -3,6 +3,7 @@ import os
 import sys
 import shutil
 import glob
+from concurrent.futures import ThreadPoolExecutor
 
 from pipeline.flip_obj_axes import flip_obj_axes
 from pipeline.compress_texture import run_texture_compression
@@ -43,17 +44,17 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
     
     print(f"Output directory: {model_output_dir}")
     
-    # Create a working copy of the input file in case we need to flip axes
+    # Flip straight into the working copy if axes need flipping - the flip
+    # already writes a separate output file, so a shutil.copy2 staging pass
+    # (a full extra read+write of the OBJ) is unnecessary
     working_input = input_file
     if args.flip_x or args.flip_y or args.flip_z:
         print("  → Flipping OBJ axes...")
-        # Create a temporary copy to modify
         temp_input = os.path.join(model_output_dir, f"temp_{input_basename}.obj")
-        shutil.copy2(input_file, temp_input)
-        
+
         flip_obj_axes(
-            input_file=temp_input,
-            output_file=None,  # Overwrite in-place
+            input_file=input_file,
+            output_file=temp_input,
             flip_x=args.flip_x,
             flip_y=args.flip_y,
             flip_z=args.flip_z,
@@ -109,32 +110,45 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
                 )
         
         # === Step 4.5: Bake textures to tiled OBJs ===
+        # Each LOD folder's bake is an independent Blender process, so run
+        # them concurrently: wall time drops from the sum of the bakes to the
+        # slowest one. Concurrency is capped because Blender is itself
+        # multi-threaded.
         print("  → Baking textures...")
-        for lod in os.listdir(tiles_base_dir):
-            lod_dir_path = os.path.join(tiles_base_dir, lod)
-            if not os.path.isdir(lod_dir_path):
-                continue
-            
-            print(f"    Baking textures in: {lod_dir_path}")
-            baked_output_dir = os.path.join(lod_dir_path, "baked")
-            run_blender_bake(
-                blender_exe=blender_config['exe'],
-                script_path=blender_config['baking_script'],
-                input_folder=lod_dir_path,
-                output_folder=baked_output_dir
-            )
-        
+        lod_folders = [os.path.join(tiles_base_dir, lod)
+                       for lod in os.listdir(tiles_base_dir)
+                       if os.path.isdir(os.path.join(tiles_base_dir, lod))]
+        if lod_folders:
+            bake_workers = min(len(lod_folders), max(1, (os.cpu_count() or 2) // 2))
+            with ThreadPoolExecutor(max_workers=bake_workers) as pool:
+                futures = []
+                for lod_dir_path in lod_folders:
+                    print(f"    Baking textures in: {lod_dir_path}")
+                    futures.append(pool.submit(
+                        run_blender_bake,
+                        blender_config['exe'],
+                        blender_config['baking_script'],
+                        lod_dir_path,
+                        os.path.join(lod_dir_path, "baked")
+                    ))
+                for future in futures:
+                    future.result()
+
         # === Step 5: Convert tiles to GLB + Generate tilesets ===
+        # Conversions are also independent per LOD folder
         print("  → Converting to GLB and generating tilesets...")
-        for lod in os.listdir(tiles_base_dir):
+
+        def convert_lod_folder(lod):
             lod_dir_path = os.path.join(tiles_base_dir, lod, "baked")
             if not os.path.isdir(lod_dir_path):
-                continue
-            
+                return
             try:
                 convert_obj_to_glb(lod_dir_path, model_output_dir)
             except Exception as e:
                 print(f"    Skipping LOD folder '{lod}': {e}")
+
+        with ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2)) as pool:
+            list(pool.map(convert_lod_folder, os.listdir(tiles_base_dir)))
         
         # === Step 6: Clean up temp directory unless --temp is used ===
         temp_dir = os.path.join(model_output_dir, "temp")
@@ -1,5 +1,14 @@
 import os
-import glob
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _process_obj_worker(task):
+    """Worker for the MTL-update pool. Unpacks one task tuple from the scandir pass."""
+    obj_file, texture_dir, lod_suffix, dir_names, texture_names = task
+    success = process_single_obj_file(obj_file, texture_dir, lod_suffix,
+                                      dir_names=dir_names, texture_names=texture_names)
+    return obj_file, success
+
 
 def update_mtl_texture_path_by_leaf(tiling_dir, texture_dir):
     """
@@ -25,16 +34,26 @@ def update_mtl_texture_path_by_leaf(tiling_dir, texture_dir):
         print(f"[Error] Texture directory not found: {texture_dir}")
         return
     
-    # Find all TileLevel_* directories
-    tile_level_dirs = glob.glob(os.path.join(tiling_dir, "TileLevel_*"))
-    
+    # One scandir per directory replaces the repeated glob + per-file
+    # os.path.exists stat() calls: existence checks become set lookups.
+    with os.scandir(texture_dir) as it:
+        texture_names = {e.name for e in it}
+
+    with os.scandir(tiling_dir) as it:
+        tile_level_dirs = [e.path for e in it
+                           if e.is_dir() and e.name.startswith("TileLevel_")]
+
     if not tile_level_dirs:
         print(f"[Warning] No TileLevel_* directories found in {tiling_dir}")
         return
     
     print(f"Found {len(tile_level_dirs)} tile level directories")
-    
-    # Process each tile level directory
+
+    # Collect tasks from every tile level directory, then process them with one
+    # shared pool. Each OBJ's MTL is independent (2 reads + 1 write, no shared
+    # state), so the per-file work is trivially parallel and I/O-bound.
+    tasks = []
+    expected_per_dir = {}
     for tile_level_dir in tile_level_dirs:
         # Extract tile level number from directory name
         dir_name = os.path.basename(tile_level_dir)
@@ -55,34 +74,57 @@ def update_mtl_texture_path_by_leaf(tiling_dir, texture_dir):
         print(f"Processing {dir_name} -> using {lod_suffix} textures")
         
         # Process all OBJ files in this tile level directory
-        obj_files = glob.glob(os.path.join(tile_level_dir, "*.obj"))
-        
+        with os.scandir(tile_level_dir) as it:
+            entries = list(it)
+        obj_files = [e.path for e in entries if e.name.endswith('.obj')]
+        dir_names = {e.name for e in entries}
+
         if not obj_files:
             print(f"[Warning] No OBJ files found in {tile_level_dir}")
             continue
-        
-        processed_count = 0
-        
+
+        expected_per_dir[dir_name] = len(obj_files)
         for obj_file in obj_files:
-            success = process_single_obj_file(obj_file, texture_dir, lod_suffix)
-            if success:
-                processed_count += 1
-        
-        print(f"  ✓ Updated {processed_count}/{len(obj_files)} OBJ files in {dir_name}")
+            tasks.append((obj_file, texture_dir, lod_suffix, dir_names, texture_names))
+
+    if not tasks:
+        return
+
+    # ThreadPoolExecutor saturates the disk queue for thousands of tiny files;
+    # results are printed on the main thread to keep output readable.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        results = list(pool.map(_process_obj_worker, tasks))
+
+    processed_per_dir = {}
+    for obj_file, success in results:
+        dir_name = os.path.basename(os.path.dirname(obj_file))
+        if success:
+            processed_per_dir[dir_name] = processed_per_dir.get(dir_name, 0) + 1
+
+    for dir_name, expected in expected_per_dir.items():
+        print(f"  ✓ Updated {processed_per_dir.get(dir_name, 0)}/{expected} OBJ files in {dir_name}")
 
 
-def process_single_obj_file(obj_path, texture_dir, lod_suffix):
+def process_single_obj_file(obj_path, texture_dir, lod_suffix, dir_names=None, texture_names=None):
     """
     Process a single OBJ file and update its corresponding MTL file.
-    
+
     Args:
         obj_path: Path to the OBJ file
         texture_dir: Path to the texture directory
         lod_suffix: LOD suffix to use (e.g., "LOD0", "LOD2", "LOD3")
-    
+        dir_names: Optional set of filenames in the OBJ's directory (from a
+                   single scandir pass); falls back to os.path.exists if None
+        texture_names: Optional set of filenames in texture_dir; same fallback
+
     Returns:
         bool: True if successful, False otherwise
     """
+    # Computed once up front; basename/dirname are Python-level string scans
+    # and were previously repeated several times per file.
+    obj_basename = os.path.basename(obj_path)
+    obj_dir = os.path.dirname(obj_path)
+
     try:
         # Read OBJ file to find MTL reference
         with open(obj_path, "r") as obj_file:
@@ -98,13 +140,16 @@ def process_single_obj_file(obj_path, texture_dir, lod_suffix):
                     break
         
         if not mtl_name:
-            print(f"[Warning] No mtllib found in {os.path.basename(obj_path)}")
+            print(f"[Warning] No mtllib found in {obj_basename}")
             return False
-        
-        # Construct MTL file path
-        mtl_path = os.path.join(os.path.dirname(obj_path), mtl_name)
-        
-        if not os.path.exists(mtl_path):
+
+        # Construct MTL file path (the MTL lives next to the OBJ)
+        mtl_path = os.path.join(obj_dir, mtl_name)
+        mtl_dir = obj_dir
+
+        mtl_missing = (mtl_name not in dir_names) if dir_names is not None \
+            else not os.path.exists(mtl_path)
+        if mtl_missing:
             print(f"[Warning] MTL file not found: {mtl_path}")
             return False
         
@@ -125,7 +170,7 @@ def process_single_obj_file(obj_path, texture_dir, lod_suffix):
                     break
         
         if not original_texture_name:
-            print(f"[Warning] No map_Kd found in {os.path.basename(mtl_path)}")
+            print(f"[Warning] No map_Kd found in {mtl_name}")
             return False
         
         # Generate new texture name with LOD suffix
@@ -138,12 +183,13 @@ def process_single_obj_file(obj_path, texture_dir, lod_suffix):
         
         # Check if the new texture file exists
         new_texture_path = os.path.join(texture_dir, new_texture_name)
-        if not os.path.exists(new_texture_path):
+        texture_missing = (new_texture_name not in texture_names) if texture_names is not None \
+            else not os.path.exists(new_texture_path)
+        if texture_missing:
             print(f"[Warning] Target texture not found: {new_texture_path}")
             # Continue anyway, as the texture might be generated later
         
         # Create relative path from MTL location to texture
-        mtl_dir = os.path.dirname(mtl_path)
         rel_texture_path = os.path.relpath(new_texture_path, mtl_dir)
         
         # Update MTL file
@@ -166,11 +212,11 @@ def process_single_obj_file(obj_path, texture_dir, lod_suffix):
             
             return True
         else:
-            print(f"[Warning] No map_Kd line found to update in {os.path.basename(mtl_path)}")
+            print(f"[Warning] No map_Kd line found to update in {mtl_name}")
             return False
-            
+
     except Exception as e:
-        print(f"[Error] Failed to process {os.path.basename(obj_path)}: {str(e)}")
+        print(f"[Error] Failed to process {obj_basename}: {str(e)}")
         return False
 
 
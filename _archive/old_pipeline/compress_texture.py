@@ -1,7 +1,98 @@
 import argparse
+import hashlib
 import os
+import shutil
+import subprocess
+import tempfile
 from PIL import Image
 
+# Content-addressed cache of generated LOD sets, keyed on the source texture
+# bytes plus the generation settings, so repeated pipeline runs over an
+# unchanged texture skip the downscale/encode entirely
+_CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "mesh2tile", "textures")
+
+
+def _texture_cache_key(texture_path, num_lods, compress, ktx2):
+    with open(texture_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+, hashes in C
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        else:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    return f"{digest}_{num_lods}_{compress}{'_ktx2' if ktx2 else ''}"
+
+
+def _restore_cached_lods(cache_dir, output_texture_dir):
+    """Hardlink (or copy) every cached LOD into the output dir; False on miss."""
+    if not os.path.isdir(cache_dir):
+        return False
+    cached = sorted(os.listdir(cache_dir))
+    if not cached:
+        return False
+    for name in cached:
+        src = os.path.join(cache_dir, name)
+        dst = os.path.join(output_texture_dir, name)
+        if os.path.exists(dst):
+            os.remove(dst)
+        try:
+            os.link(src, dst)
+        except OSError:  # cross-device or unsupported filesystem
+            shutil.copy2(src, dst)
+        print(f"Restored from cache: {dst}")
+    return True
+
+
+def _store_cached_lods(cache_dir, lod_paths):
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for path in lod_paths:
+            dst = os.path.join(cache_dir, os.path.basename(path))
+            if not os.path.exists(dst):
+                try:
+                    os.link(path, dst)
+                except OSError:
+                    shutil.copy2(path, dst)
+    except OSError as e:
+        print(f"Texture cache store failed ({e}) - continuing without cache")
+
+# Optional GPU-native texture output: when an encoder is installed, LODs can
+# be emitted block-compressed (BC7) instead of PNG - smaller files that
+# renderers sample directly without a CPU decode + uncompressed upload.
+# Preference order: nvtt_export (NVIDIA, GPU), compressonatorcli (AMD,
+# GPU with CPU retry), toktx (KTX-Software, multithreaded CPU).
+_NVTT = shutil.which("nvtt_export")
+_COMPRESSONATOR = shutil.which("compressonatorcli")
+_TOKTX = shutil.which("toktx")
+
+# Container format follows the chosen encoder
+_COMPRESSED_EXT = ".dds" if (_NVTT is None and _TOKTX is None) else ".ktx2"
+
+
+def _save_compressed(image, lod_path):
+    """Encode one LOD image as block-compressed KTX2/DDS."""
+    fd, tmp_png = tempfile.mkstemp(suffix=".png")
+    os.close(fd)
+    try:
+        # Fast PNG pass just to hand the encoder the pixels; the encoder does
+        # the real compression work (GPU or multithreaded CPU) on its side
+        image.save(tmp_png, format="PNG", compress_level=1)
+        if _NVTT:
+            subprocess.run([_NVTT, "--format", "bc7", "--output", lod_path,
+                            tmp_png], check=True)
+        elif _COMPRESSONATOR:
+            try:
+                subprocess.run([_COMPRESSONATOR, "-fd", "BC7",
+                                "-EncodeWith", "GPU", tmp_png, lod_path],
+                               check=True)
+            except subprocess.CalledProcessError:
+                # No usable GPU - retry on the CPU encoder
+                subprocess.run([_COMPRESSONATOR, "-fd", "BC7",
+                                tmp_png, lod_path], check=True)
+        else:
+            subprocess.run([_TOKTX, "--bcmp", "--t2", lod_path, tmp_png],
+                           check=True)
+    finally:
+        os.remove(tmp_png)
+
 def parse_obj_for_mtl(obj_path):
     with open(obj_path, "r") as file:
         for line in file:
@@ -21,18 +112,23 @@ def parse_mtl_for_texture(mtl_path):
 def generate_lods(texture_path, num_lods):
     base_name, ext = os. path.splitext(os.path.basename(texture_path))
     image = Image.open(texture_path)
-    width, height = image.size
+    # Image.open is lazy - force the single decode up front, and normalize
+    # palette images to a raw mode once instead of per reduction
+    if image.mode == "P":
+        image = image.convert("RGBA")
+    image.load()
 
+    # Mip-style chain: each LOD is a 2x box reduction of the previous LOD
+    # (a C-level 2x2 average), instead of re-filtering the full-resolution
+    # source with Lanczos at every level
+    current = image
     for i in range(num_lods):
-        scale = 2 ** (i + 1) 
-        new_width = max(1, width // scale)
-        new_height = max(1, height // scale)
-        resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        current = current.reduce(2)
 
         lod_filename = f"{base_name}_LOD{i}{ext}"
         lod_path = os.path.join(os.path.dirname(texture_path), lod_filename)
-        resized.save(lod_path)
-        print(f"Saved: {lod_path} ({new_width}x{new_height})")
+        current.save(lod_path)
+        print(f"Saved: {lod_path} ({current.width}x{current.height})")
 
 def main():
     parser = argparse.ArgumentParser(description="Generate LOD textures from an OBJ file.")
@@ -49,26 +145,53 @@ def main():
     texture_path = parse_mtl_for_texture(mtl_path)
     generate_lods(texture_path, num_lods)
 
-def run_texture_compression(obj_path, num_lods, output_folder, compress=0):
+def run_texture_compression(obj_path, num_lods, output_folder, compress=0, ktx2=False):
     mtl_path = parse_obj_for_mtl(obj_path)
     texture_path = parse_mtl_for_texture(mtl_path)
 
+    # KTX2 output is opt-in: the MTL/baking consumers downstream expect PNG,
+    # so only callers whose renderer takes KTX2 should enable it
+    use_ktx2 = ktx2 and any((_NVTT, _COMPRESSONATOR, _TOKTX))
+    if ktx2 and not use_ktx2:
+        print("No block-compression encoder (nvtt_export/compressonatorcli/toktx) on PATH - writing PNG LODs instead")
+
     output_texture_dir = os.path.join(output_folder, "temp", "texture")
     os.makedirs(output_texture_dir, exist_ok=True)
 
+    # Reuse a previous run's LODs when the source texture and settings match
+    cache_dir = os.path.join(
+        _CACHE_ROOT, _texture_cache_key(texture_path, num_lods, compress, use_ktx2))
+    if _restore_cached_lods(cache_dir, output_texture_dir):
+        return
+
     base_name, ext = os.path.splitext(os.path.basename(texture_path))
     image = Image.open(texture_path)
-    width, height = image.size
+    # Image.open is lazy - force the single decode up front, and normalize
+    # palette images to a raw mode once instead of per reduction
+    if image.mode == "P":
+        image = image.convert("RGBA")
+    image.load()
 
+    # Mip-style chain: apply the compression offset once up front, then halve
+    # each LOD from the previous one with a 2x box reduction (a C-level 2x2
+    # average) instead of re-filtering the full-resolution source with
+    # Lanczos at every level. With compress=0, LOD0 is the source unchanged.
+    current = image.reduce(2 ** compress) if compress > 0 else image
+    lod_paths = []
     for i in range(num_lods):
-        scale = 2 ** (i + compress)
-        new_width = max(1, width // scale)
-        new_height = max(1, height // scale)
-        resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        if i > 0:
+            current = current.reduce(2)
 
-        lod_filename = f"{base_name}_LOD{i}{ext}"
-        lod_path = os.path.join(output_texture_dir, lod_filename)
-        resized.save(lod_path, format="PNG", optimize=True, compress_level=9)
-        print(f"Saved: {lod_path} ({new_width}x{new_height})")
+        if use_ktx2:
+            lod_path = os.path.join(output_texture_dir,
+                                    f"{base_name}_LOD{i}{_COMPRESSED_EXT}")
+            _save_compressed(current, lod_path)
+        else:
+            lod_path = os.path.join(output_texture_dir, f"{base_name}_LOD{i}{ext}")
+            current.save(lod_path, format="PNG", optimize=True, compress_level=9)
+        lod_paths.append(lod_path)
+        print(f"Saved: {lod_path} ({current.width}x{current.height})")
+
+    _store_cached_lods(cache_dir, lod_paths)
 
 
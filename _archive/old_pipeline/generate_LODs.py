@@ -1,5 +1,16 @@
+import os
 import subprocess
 
+# LOD reduction ratios (fraction of original geometry to keep), matching
+# the ratios used by BlenderScripts/lodOBJ.py.
+LOD_RATIOS = [1.0, 0.1, 0.05, 0.01]
+
+try:
+    import trimesh
+except ImportError:
+    trimesh = None
+
+
 def run_blender_lod_gen(blender_path, script_path, input, output, lods):
     cmd = [
         blender_path,
@@ -11,3 +22,57 @@ def run_blender_lod_gen(blender_path, script_path, input, output, lods):
         "--lods", str(lods)
     ]
     subprocess.run(cmd)
+
+
+def run_blender_lod_gen_async(blender_path, script_path, input, output, lods):
+    """
+    Non-blocking variant of run_blender_lod_gen. Returns the Popen handle so a
+    batched caller can keep a bounded list of in-flight Blender processes and
+    overlap LOD generation with other files' I/O.
+    """
+    cmd = [
+        blender_path,
+        "--background",
+        "--python", script_path,
+        "--",
+        "--input", input,
+        "--output", output,
+        "--lods", str(lods)
+    ]
+    return subprocess.Popen(cmd)
+
+
+def run_fast_decimate(input, output, lods):
+    """
+    Generate LOD meshes directly with trimesh's quadric decimation, skipping
+    the multi-second Blender cold start per file. Loads the OBJ once and
+    reuses it for every ratio. Returns False when trimesh is unavailable or
+    decimation fails, so callers can fall back to run_blender_lod_gen (which
+    handles materials-heavy models better).
+    """
+    if trimesh is None:
+        print("trimesh not available - falling back to Blender for LOD generation")
+        return False
+
+    lod_dir = os.path.join(output, "temp", "lods")
+    os.makedirs(lod_dir, exist_ok=True)
+    base_name = os.path.splitext(os.path.basename(input))[0]
+
+    try:
+        mesh = trimesh.load(input, force='mesh')
+        ratios = LOD_RATIOS[:lods]
+
+        for i, ratio in enumerate(ratios):
+            if ratio >= 1.0:
+                lod_mesh = mesh
+            else:
+                lod_mesh = mesh.simplify_quadric_decimation(int(len(mesh.faces) * ratio))
+
+            lod_path = os.path.join(lod_dir, f"{base_name}_LOD{i}.obj")
+            lod_mesh.export(lod_path)
+            print(f"Saved: {lod_path} ({len(lod_mesh.faces)} faces)")
+
+        return True
+    except Exception as e:
+        print(f"Fast decimation failed for {input}: {e}")
+        return False
@@ -1,33 +1,120 @@
 import subprocess
+import json
 import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Resolved once at import: shutil.which finds the executables on PATH on any
+# platform, with the historical Windows install locations as fallbacks
+NODE_PATH = shutil.which("npx") or r"C:\Program Files\nodejs\npx.cmd"
+NODE_EXE = shutil.which("node") or r"C:\Program Files\nodejs\node.exe"
+
+# Runner executed once per batch: Node+npx startup dominates when converting
+# many small tiles one process at a time, so all conversions (and the GLB
+# moves) happen inside a single Node process reading a JSON manifest.
+_BATCH_CONVERT_JS = """\
+const fs = require('fs');
+const path = require('path');
+const obj23dtiles = require('obj23dtiles');
+
+const manifest = JSON.parse(fs.readFileSync(process.argv[2], 'utf8'));
+
+(async () => {
+    for (const objPath of manifest.files) {
+        const glbPath = objPath.replace(/\\.obj$/i, '.glb');
+        try {
+            await obj23dtiles(objPath, glbPath, { binary: true });
+            const dst = path.join(manifest.outputDir, path.basename(glbPath));
+            if (path.resolve(glbPath) !== path.resolve(dst)) {
+                fs.renameSync(glbPath, dst);
+            }
+            console.log('\\u2705 Converted: ' + path.basename(glbPath));
+        } catch (err) {
+            console.error('\\u274c Failed to convert ' + path.basename(objPath) +
+                          ' \\u2014 skipping (' + err.message + ')');
+        }
+    }
+})();
+"""
 
-NODE_PATH = r"C:\Program Files\nodejs\npx.cmd"
 
 def convert_obj_to_glb(input_dir, output_dir):
     print(f"Converting OBJs in {input_dir} to GLB...")
     os.makedirs(output_dir, exist_ok=True)
 
-    for file_name in os.listdir(input_dir):
-        if not file_name.lower().endswith(".obj"):
-            continue
-        
+    # scandir keeps the DirEntry's cached file type, avoiding a stat per entry
+    with os.scandir(input_dir) as it:
+        obj_files = [e.path for e in it
+                     if e.is_file() and e.name.lower().endswith(".obj")]
+    if not obj_files:
+        return
+
+    # Each conversion is independent and CPU-bound inside Node, so the batch
+    # is sharded across a bounded pool of Node processes: startup stays
+    # amortized per shard while all cores are kept busy.
+    num_shards = min(os.cpu_count() or 1, len(obj_files))
+    shards = [obj_files[i::num_shards] for i in range(num_shards)]
+
+    try:
+        if num_shards == 1:
+            _convert_batch(obj_files, output_dir)
+        else:
+            with ThreadPoolExecutor(max_workers=num_shards) as pool:
+                futures = [pool.submit(_convert_batch, shard, output_dir)
+                           for shard in shards]
+                for future in futures:
+                    future.result()
+    except (subprocess.CalledProcessError, OSError) as e:
+        # Batch runner unavailable (e.g. obj23dtiles not resolvable outside
+        # npx) - fall back to the original one-process-per-file loop.
+        print(f"Batch conversion failed ({e}); falling back to per-file npx")
+        _convert_per_file(obj_files, output_dir)
+
+
+def _convert_batch(obj_files, output_dir):
+    """Convert every OBJ in one Node process, amortizing interpreter startup."""
+    # obj23dtiles is installed globally for npx; point Node's resolver there
+    env = dict(os.environ)
+    if "NODE_PATH" not in env:
+        try:
+            npm_root = subprocess.run(
+                ["npm", "root", "-g"], capture_output=True, text=True,
+                check=True, shell=(os.name == "nt")).stdout.strip()
+            env["NODE_PATH"] = npm_root
+        except (subprocess.CalledProcessError, OSError):
+            pass
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runner_path = os.path.join(tmp, "convert_all.js")
+        manifest_path = os.path.join(tmp, "manifest.json")
+        with open(runner_path, "w") as f:
+            f.write(_BATCH_CONVERT_JS)
+        with open(manifest_path, "w") as f:
+            json.dump({"files": obj_files, "outputDir": output_dir}, f)
+
+        subprocess.run([NODE_EXE, runner_path, manifest_path], check=True, env=env)
 
-        input_obj_path = os.path.join(input_dir, file_name)
 
+def _convert_per_file(obj_files, output_dir):
+    for input_obj_path in obj_files:
+        file_name = os.path.basename(input_obj_path)
         try:
             subprocess.run([
                 NODE_PATH, "obj23dtiles",
                 "-i", input_obj_path, "-b"
             ], check=True)
 
-            # Move resulting .glb to output
-            for file in os.listdir(os.path.dirname(input_obj_path)):
-                if file.lower().endswith(".glb"):
-                    src = os.path.join(os.path.dirname(input_obj_path), file)
-                    dst = os.path.join(output_dir, file)
-                    if os.path.abspath(src) != os.path.abspath(dst):
-                        os.replace(src, dst)
-                        print(f"✅ Converted: {file}")
+            # obj23dtiles writes the GLB next to the OBJ with the same stem;
+            # move exactly that file instead of rescanning the whole source
+            # directory (which was O(N^2) over the batch and could re-move
+            # GLBs produced by earlier iterations)
+            expected_glb = os.path.splitext(input_obj_path)[0] + ".glb"
+            glb_name = os.path.basename(expected_glb)
+            dst = os.path.join(output_dir, glb_name)
+            if os.path.abspath(expected_glb) != os.path.abspath(dst):
+                os.replace(expected_glb, dst)
+                print(f"✅ Converted: {glb_name}")
 
         except subprocess.CalledProcessError:
             print(f"❌ Failed to convert {file_name} — skipping (non-zero exit code)")
@@ -50,7 +137,7 @@ def generate_tileset_json(output_dir, longitude="-75.703833", latitude="45.41713
 def gzip_output(output_path):
     print("Gzipping tiles...")
     subprocess.run([
-        r"C:\Program Files\nodejs\npx.cmd", "3d-tiles-tools", "gzip",
+        NODE_PATH, "3d-tiles-tools", "gzip",
         "-i", output_path,
         "-o", output_path,
         "-f",
@@ -1,5 +1,11 @@
 import argparse
+import atexit
+import hashlib
+import json
+import logging
+import logging.handlers
 import os
+import queue
 import sys
 import shutil
 import glob
@@ -14,25 +20,118 @@ if sys.platform == 'win32':
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
-from pipeline.triggerBlender import run_blender_script, run_blender_bake
+from pipeline.triggerBlender import run_blender_script, run_blender_bake, run_blender_manifest
 from pipeline.node_processes import generate_tileset_json, gzip_output
 from pipeline.blender_obj2glb import convert_obj_to_glb_blender
 from pipeline.createTilesetJson import restructure_tileset
 
+# Progress output goes through this logger rather than print(): with --jobs
+# concurrent files every print contends on the stdout lock and flushes
+# inline, serializing the workers. log.info only enqueues the record; one
+# QueueListener thread (started in main) does the actual writing.
+log = logging.getLogger("mesh2tile")
+
+
+def _start_log_listener():
+    """
+    Route this module's logger through a queue to a single writer thread.
+
+    Returns the started QueueListener; main registers its stop() with atexit
+    so queued records are flushed on any exit path. Output format stays the
+    bare message on stdout, so the console output is unchanged from the
+    print() days. Worker functions that run in ProcessPoolExecutor children
+    keep print(): spawned processes don't inherit this handler setup.
+    """
+    log_queue = queue.SimpleQueue()
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    listener = logging.handlers.QueueListener(
+        log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
+
 
 def find_obj_files(input_dir):
     """
     Recursively find all OBJ files in the input directory and its subdirectories.
     Returns a list of absolute paths to OBJ files.
+
+    Walks with os.scandir directly: the cached entry type from readdir avoids
+    the per-entry stat that os.walk pays, which matters on big trees and
+    network filesystems.
     """
     obj_files = []
-    for root, dirs, files in os.walk(input_dir):
-        for file in files:
-            if file.lower().endswith('.obj'):
-                obj_files.append(os.path.join(root, file))
+    stack = [input_dir]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Unreadable subdirectory - skip it, as os.walk did by default
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith('.obj'):
+                    obj_files.append(entry.path)
     return obj_files
 
 
+# Fields of args that change what the pipeline writes. Parallelism knobs and
+# bookkeeping flags are deliberately excluded so tweaking a worker count
+# doesn't invalidate every existing output
+_STAMP_ARGS = ("lods", "compress", "gzip", "longitude", "latitude", "height")
+_STAMP_NAME = ".m2t-stamp"
+
+
+def _pipeline_stamp(input_file, args):
+    """
+    Hex digest identifying one pipeline run: the source OBJ bytes (plus its
+    MTL and texture when referenced) and the output-affecting arguments.
+    A matching stamp means rerunning would reproduce the existing output, so
+    batch reruns only pay for the files that actually changed.
+    """
+    hasher = hashlib.sha256()
+
+    def add_file(path):
+        with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+, hashes in C
+                hasher.update(hashlib.file_digest(f, "sha256").digest())
+            else:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    hasher.update(chunk)
+
+    add_file(input_file)
+
+    # Follow the OBJ -> MTL -> texture references so editing either one also
+    # invalidates the stamp; both are optional in a valid OBJ
+    try:
+        mtl_path = None
+        with open(input_file, "r", errors="ignore") as f:
+            for line in f:
+                if line.startswith("mtllib"):
+                    mtl_path = os.path.join(os.path.dirname(input_file),
+                                            line.split(None, 1)[1].strip())
+                    break
+        if mtl_path and os.path.isfile(mtl_path):
+            add_file(mtl_path)
+            with open(mtl_path, "r", errors="ignore") as f:
+                for line in f:
+                    if line.lower().startswith("map_kd"):
+                        texture_path = os.path.join(
+                            os.path.dirname(mtl_path),
+                            line.split(None, 1)[1].strip())
+                        if os.path.isfile(texture_path):
+                            add_file(texture_path)
+                        break
+    except OSError:
+        pass
+
+    fingerprint = {key: getattr(args, key) for key in _STAMP_ARGS}
+    hasher.update(json.dumps(fingerprint, sort_keys=True).encode())
+    return hasher.hexdigest()
+
+
 def bake_single_tile(args):
     """Worker function for parallel baking of a single tile file"""
     obj_file, output_dir, blender_config, tile_index, total_tiles = args
@@ -135,13 +234,17 @@ def process_chunk_worker(task, blender_config):
         return False, str(e)
 
 
-def process_single_obj(input_file, output_base_dir, args, blender_config):
+def process_single_obj(input_file, output_base_dir, args, blender_config, pretiled=False):
     """
     Process a single OBJ file through the entire pipeline with parallelization.
+
+    pretiled: tiles for this file were already generated by the batched
+    Blender session (--batch-tiling), which also made the skip/force
+    decisions, so Step 1 and the output-directory checks are bypassed.
     """
-    print(f"\n{'='*60}")
-    print(f"Processing: {input_file}")
-    print(f"{'='*60}")
+    log.info(f"\n{'='*60}")
+    log.info(f"Processing: {input_file}")
+    log.info(f"{'='*60}")
     
     # Get the base name of the input file (e.g., building_LOD400.obj → building_LOD400)
     input_basename = os.path.splitext(os.path.basename(input_file))[0]
@@ -149,18 +252,43 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
     # Create output directory for this specific model
     model_output_dir = os.path.join(output_base_dir, input_basename)
     
+    # Stamp of this run's inputs + settings, compared against the sidecar
+    # left by a previous run to decide whether anything needs redoing. A
+    # source that vanished or became unreadable since discovery is a normal
+    # per-file failure, not a crash of the whole batch
+    try:
+        stamp = _pipeline_stamp(input_file, args)
+    except OSError as e:
+        log.info(f"  ✗ Error reading {input_file}: {e}")
+        return False
+    stamp_path = os.path.join(model_output_dir, _STAMP_NAME)
+
     # Check if output directory already exists
-    if os.path.exists(model_output_dir):
+    if not pretiled and os.path.exists(model_output_dir):
         if args.force:
-            print(f"  ⚠ Output directory exists, removing due to --force: {model_output_dir}")
+            log.info(f"  ⚠ Output directory exists, removing due to --force: {model_output_dir}")
             shutil.rmtree(model_output_dir)
         else:
-            print(f"  ⊗ Output directory already exists, skipping: {model_output_dir}")
-            return None  # Return None to indicate skipped (not success or failure)
+            try:
+                with open(stamp_path) as f:
+                    previous_stamp = f.read().strip()
+            except OSError:
+                previous_stamp = None
+
+            if previous_stamp == stamp:
+                log.info(f"  ⊗ Skipped (unchanged since last run): {model_output_dir}")
+                return None  # Return None to indicate skipped (not success or failure)
+            if previous_stamp is None:
+                # Output predates stamping (or came from elsewhere); keep the
+                # conservative skip rather than clobbering it
+                log.info(f"  ⊗ Output directory already exists, skipping: {model_output_dir}")
+                return None
+            log.info(f"  ↻ Source or settings changed since last run - reprocessing: {model_output_dir}")
+            shutil.rmtree(model_output_dir)
 
     os.makedirs(model_output_dir, exist_ok=True)
     
-    print(f"Output directory: {model_output_dir}")
+    log.info(f"Output directory: {model_output_dir}")
 
     # Track timing for performance analysis
     pipeline_start_time = time.time()
@@ -169,16 +297,18 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
     try:
 
         # === Step 1: Run adaptive Tiling on Mesh ===
-        print("  → Generating tiles using octree format...")
+        log.info("  → Generating tiles using octree format...")
         step1_start = time.time()
         tiling_dir = os.path.join(model_output_dir, "temp", "tiles")
 
-        if args.parallel_tiling:
+        if pretiled and os.path.isdir(tiling_dir):
+            log.info("    ✓ Tiles already generated by the batched Blender session")
+        elif args.parallel_tiling:
             # PHASE 3: Parallel tiling mode
-            print("    🔀 Parallel tiling enabled")
+            log.info("    🔀 Parallel tiling enabled")
 
             # Step 1a: Perform first split to create chunks
-            print("    Step 1a: Performing initial octree split...")
+            log.info("    Step 1a: Performing initial octree split...")
             run_blender_script(
                 input_path=input_file,
                 output_dir=tiling_dir,
@@ -192,7 +322,7 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
             chunk_files = glob.glob(os.path.join(chunks_dir, "*.obj"))
 
             if not chunk_files:
-                print("    ⚠ Warning: No chunks found. Falling back to sequential processing.")
+                log.info("    ⚠ Warning: No chunks found. Falling back to sequential processing.")
                 run_blender_script(
                     input_path=input_file,
                     output_dir=tiling_dir,
@@ -201,7 +331,7 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
                     extra_args=[str(args.lods)]
                 )
             else:
-                print(f"    Step 1b: Processing {len(chunk_files)} chunks in parallel with {args.max_tiling_workers} workers...")
+                log.info(f"    Step 1b: Processing {len(chunk_files)} chunks in parallel with {args.max_tiling_workers} workers...")
 
                 # Create worker tasks
                 worker_tasks = []
@@ -234,23 +364,23 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
                             completed_count += 1
 
                             if success:
-                                print(f"    ✓ [{completed_count}/{len(worker_tasks)}] Processed chunk: {chunk_name}")
+                                log.info(f"    ✓ [{completed_count}/{len(worker_tasks)}] Processed chunk: {chunk_name}")
                             else:
-                                print(f"    ✗ [{completed_count}/{len(worker_tasks)}] Failed chunk {chunk_name}: {error}")
+                                log.info(f"    ✗ [{completed_count}/{len(worker_tasks)}] Failed chunk {chunk_name}: {error}")
                                 failed_chunks.append(chunk_name)
                         except Exception as e:
                             completed_count += 1
-                            print(f"    ✗ [{completed_count}/{len(worker_tasks)}] Exception processing {chunk_name}: {e}")
+                            log.info(f"    ✗ [{completed_count}/{len(worker_tasks)}] Exception processing {chunk_name}: {e}")
                             failed_chunks.append(chunk_name)
 
                 if failed_chunks:
-                    print(f"    ⚠ Warning: {len(failed_chunks)} chunks failed to process")
+                    log.info(f"    ⚠ Warning: {len(failed_chunks)} chunks failed to process")
                 else:
-                    print(f"    ✓ All {len(worker_tasks)} chunks processed successfully")
+                    log.info(f"    ✓ All {len(worker_tasks)} chunks processed successfully")
 
                 # Clean up temporary chunk files
                 shutil.rmtree(chunks_dir)
-                print(f"    Cleaned up temporary chunks directory")
+                log.info(f"    Cleaned up temporary chunks directory")
 
         else:
             # Sequential processing (default)
@@ -263,13 +393,13 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
             )
 
         phase_times['Step 1: Adaptive Tiling'] = time.time() - step1_start
-        print(f"    ⏱ Tiling completed in {phase_times['Step 1: Adaptive Tiling']:.2f}s")
+        log.info(f"    ⏱ Tiling completed in {phase_times['Step 1: Adaptive Tiling']:.2f}s")
 
         # === Step 2: Bake textures to tiled OBJs ===
         step2_start = time.time()
         if args.batch_bake:
             # BATCH MODE: Process all tiles per LOD in single Blender session
-            print("  → Baking textures (batch mode - per LOD processing)...")
+            log.info("  → Baking textures (batch mode - per LOD processing)...")
 
             batch_tasks = []
             for lod in sorted(os.listdir(tiling_dir)):
@@ -284,8 +414,8 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
 
             if batch_tasks:
                 max_bake_workers = min(len(batch_tasks), args.max_bake_workers)
-                print(f"    Processing {len(batch_tasks)} LOD levels with {max_bake_workers} parallel Blender sessions")
-                print(f"    🔄 Batch mode: each Blender session processes all tiles in its LOD")
+                log.info(f"    Processing {len(batch_tasks)} LOD levels with {max_bake_workers} parallel Blender sessions")
+                log.info(f"    🔄 Batch mode: each Blender session processes all tiles in its LOD")
 
                 completed_lods = 0
                 total_tiles_processed = 0
@@ -301,23 +431,23 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
 
                             if success:
                                 total_tiles_processed += tile_count
-                                print(f"    ✓ [{completed_lods}/{len(batch_tasks)}] Completed {lod}: {tile_count} tiles baked")
+                                log.info(f"    ✓ [{completed_lods}/{len(batch_tasks)}] Completed {lod}: {tile_count} tiles baked")
                             else:
-                                print(f"    ✗ [{completed_lods}/{len(batch_tasks)}] Failed {lod}: {error}")
+                                log.info(f"    ✗ [{completed_lods}/{len(batch_tasks)}] Failed {lod}: {error}")
                                 failed_lods.append(lod)
                         except Exception as e:
                             completed_lods += 1
-                            print(f"    ✗ [{completed_lods}/{len(batch_tasks)}] Exception: {e}")
+                            log.info(f"    ✗ [{completed_lods}/{len(batch_tasks)}] Exception: {e}")
 
                 if failed_lods:
-                    print(f"    ⚠ Warning: {len(failed_lods)} LOD levels failed to bake")
+                    log.info(f"    ⚠ Warning: {len(failed_lods)} LOD levels failed to bake")
                 else:
-                    print(f"    ✓ All {len(batch_tasks)} LOD levels completed ({total_tiles_processed} total tiles)")
+                    log.info(f"    ✓ All {len(batch_tasks)} LOD levels completed ({total_tiles_processed} total tiles)")
             else:
-                print("    No tiles found for baking")
+                log.info("    No tiles found for baking")
         else:
             # PER-TILE MODE: Process each tile in parallel (default)
-            print("  → Baking textures (per-tile parallel processing)...")
+            log.info("  → Baking textures (per-tile parallel processing)...")
 
             # Collect ALL individual OBJ tiles from ALL LOD folders
             bake_tasks = []
@@ -343,8 +473,8 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
                 total_tiles = len(bake_tasks)
                 max_bake_workers = args.max_bake_workers
 
-                print(f"    Baking {total_tiles} tiles across ALL LOD levels with {max_bake_workers} workers")
-                print(f"    ⚡ Per-tile parallelization ensures all workers stay busy")
+                log.info(f"    Baking {total_tiles} tiles across ALL LOD levels with {max_bake_workers} workers")
+                log.info(f"    ⚡ Per-tile parallelization ensures all workers stay busy")
 
                 completed_count = 0
                 failed_tiles = []
@@ -358,26 +488,26 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
                             completed_count += 1
 
                             if success:
-                                print(f"    ✓ [{completed_count}/{total_tiles}] Baked: {tile_name}")
+                                log.info(f"    ✓ [{completed_count}/{total_tiles}] Baked: {tile_name}")
                             else:
-                                print(f"    ✗ [{completed_count}/{total_tiles}] Failed: {tile_name} - {error}")
+                                log.info(f"    ✗ [{completed_count}/{total_tiles}] Failed: {tile_name} - {error}")
                                 failed_tiles.append(tile_name)
                         except Exception as e:
                             completed_count += 1
-                            print(f"    ✗ [{completed_count}/{total_tiles}] Exception: {e}")
+                            log.info(f"    ✗ [{completed_count}/{total_tiles}] Exception: {e}")
 
                 if failed_tiles:
-                    print(f"    ⚠ Warning: {len(failed_tiles)} tiles failed to bake")
+                    log.info(f"    ⚠ Warning: {len(failed_tiles)} tiles failed to bake")
                 else:
-                    print(f"    ✓ All {total_tiles} tiles baked successfully")
+                    log.info(f"    ✓ All {total_tiles} tiles baked successfully")
             else:
-                print("    No tiles found for baking")
+                log.info("    No tiles found for baking")
 
         phase_times['Step 2: Texture Baking'] = time.time() - step2_start
-        print(f"    ⏱ Baking completed in {phase_times['Step 2: Texture Baking']:.2f}s")
+        log.info(f"    ⏱ Baking completed in {phase_times['Step 2: Texture Baking']:.2f}s")
 
         # === Step 3: Convert tiles to GLB + Generate tilesets (PARALLELIZED) ===
-        print("  → Converting to GLB and generating tilesets (parallel processing)...")
+        log.info("  → Converting to GLB and generating tilesets (parallel processing)...")
         step3_start = time.time()
         
         # Collect all baked LOD folders for GLB conversion
@@ -393,7 +523,7 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
             # No longer using obj23dtiles/npm which had cache contention issues
             max_conversion_workers = args.max_conversion_workers if hasattr(args, 'max_conversion_workers') else min(4, max(1, multiprocessing.cpu_count() // 2))
 
-            print(f"    Launching {len(conversion_tasks)} conversion tasks with {max_conversion_workers} workers (Blender-based)")
+            log.info(f"    Launching {len(conversion_tasks)} conversion tasks with {max_conversion_workers} workers (Blender-based)")
             
             with ProcessPoolExecutor(max_workers=max_conversion_workers) as executor:
                 futures = {executor.submit(convert_lod_to_glb, task): task[0] for task in conversion_tasks}
@@ -403,16 +533,16 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
                     try:
                         result_lod, success, error = future.result()
                         if success:
-                            print(f"    ✓ Converted LOD: {result_lod}")
+                            log.info(f"    ✓ Converted LOD: {result_lod}")
                         else:
-                            print(f"    ✗ Failed to convert LOD {result_lod}: {error}")
+                            log.info(f"    ✗ Failed to convert LOD {result_lod}: {error}")
                     except Exception as e:
-                        print(f"    ✗ Exception during conversion LOD {lod}: {e}")
+                        log.info(f"    ✗ Exception during conversion LOD {lod}: {e}")
         else:
-            print("    No baked LOD folders found for conversion")
+            log.info("    No baked LOD folders found for conversion")
 
         phase_times['Step 3: GLB Conversion'] = time.time() - step3_start
-        print(f"    ⏱ Conversion completed in {phase_times['Step 3: GLB Conversion']:.2f}s")
+        log.info(f"    ⏱ Conversion completed in {phase_times['Step 3: GLB Conversion']:.2f}s")
 
         # === Step 4: Clean up temp directory unless --temp is used ===
         temp_dir = os.path.join(model_output_dir, "temp")
@@ -420,7 +550,7 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
             shutil.rmtree(temp_dir)
 
         # === Step 5: Generate and restructure tileset.json ===
-        print("  → Generating tileset.json...")
+        log.info("  → Generating tileset.json...")
         step5_start = time.time()
         tileset_path = os.path.join(model_output_dir, "tileset.json")
         generate_tileset_json(model_output_dir,
@@ -432,7 +562,7 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
 
         # === Step 6: Gzip the final output if --gzip is enabled ===
         if args.gzip:
-            print("  → Applying gzip compression...")
+            log.info("  → Applying gzip compression...")
             step6_start = time.time()
             gzip_output(model_output_dir)
             phase_times['Step 6: Gzip Compression'] = time.time() - step6_start
@@ -441,20 +571,24 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
         total_time = time.time() - pipeline_start_time
 
         # Print timing summary
-        print(f"\n  {'='*60}")
-        print(f"  ⏱  PERFORMANCE SUMMARY")
-        print(f"  {'='*60}")
+        log.info(f"\n  {'='*60}")
+        log.info(f"  ⏱  PERFORMANCE SUMMARY")
+        log.info(f"  {'='*60}")
         for phase, duration in phase_times.items():
             percent = (duration / total_time * 100) if total_time > 0 else 0
-            print(f"  {phase:.<40} {duration:>8.2f}s ({percent:>5.1f}%)")
-        print(f"  {'-'*60}")
-        print(f"  {'TOTAL PIPELINE TIME':.<40} {total_time:>8.2f}s")
-        print(f"  {'='*60}")
+            log.info(f"  {phase:.<40} {duration:>8.2f}s ({percent:>5.1f}%)")
+        log.info(f"  {'-'*60}")
+        log.info(f"  {'TOTAL PIPELINE TIME':.<40} {total_time:>8.2f}s")
+        log.info(f"  {'='*60}")
+
+        # Record the stamp so an unchanged rerun skips this file entirely
+        with open(stamp_path, "w") as f:
+            f.write(stamp + "\n")
+
+        log.info(f"  ✓ Successfully processed: {input_basename}")
 
-        print(f"  ✓ Successfully processed: {input_basename}")
-        
     except Exception as e:
-        print(f"  ✗ Error processing {input_basename}: {str(e)}")
+        log.info(f"  ✗ Error processing {input_basename}: {str(e)}")
         import traceback
         traceback.print_exc()
         return False
@@ -463,6 +597,11 @@ def process_single_obj(input_file, output_base_dir, args, blender_config):
 
 
 def main():
+    # Single writer thread for all progress output; stopped at exit so the
+    # queue drains even when we bail out through sys.exit
+    listener = _start_log_listener()
+    atexit.register(listener.stop)
+
     # === Parse CLI arguments ===
     parser = argparse.ArgumentParser(description="Batch mesh-to-tileset pipeline for directory processing with parallelization.")
     parser.add_argument("--input", "-i", required=True, help="Path to input directory containing OBJ files")
@@ -475,12 +614,16 @@ def main():
     parser.add_argument("--continue-on-error", action="store_true", help="Continue processing other files if one fails")
     
     # Parallelization options
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                       help="Number of OBJ files to process concurrently (default: 1; the stages inside each file already run in parallel)")
     parser.add_argument("--max-bake-workers", type=int, default=None,
                        help="Maximum parallel Blender instances for baking (default: CPU cores / 2, max 8)")
     parser.add_argument("--max-conversion-workers", type=int, default=None,
                        help="Maximum parallel workers for GLB conversion (default: CPU cores)")
     parser.add_argument("--batch-bake", action="store_true",
                        help="Use batch baking mode (process all tiles per LOD in single Blender session). Faster startup but sequential tile processing.")
+    parser.add_argument("--batch-tiling", action="store_true",
+                       help="Tile every OBJ in ONE Blender session via a JSON manifest (pays the Blender cold start once per batch instead of once per file)")
     parser.add_argument("--parallel-tiling", action="store_true",
                        help="Phase 3: Enable parallel octree tiling (process first-level chunks in parallel)")
     parser.add_argument("--max-tiling-workers", type=int, default=None,
@@ -512,7 +655,7 @@ def main():
     # Validate input directory
     input_dir = os.path.abspath(args.input)
     if not os.path.isdir(input_dir):
-        print(f"Error: Input path '{args.input}' is not a valid directory.")
+        log.info(f"Error: Input path '{args.input}' is not a valid directory.")
         sys.exit(1)
     
     # Create output directory
@@ -532,55 +675,137 @@ def main():
     }
     
     # Find all OBJ files in the input directory
-    print(f"Searching for OBJ files in: {input_dir}")
+    log.info(f"Searching for OBJ files in: {input_dir}")
     obj_files = find_obj_files(input_dir)
     
     if not obj_files:
-        print("No OBJ files found in the input directory or its subdirectories.")
+        log.info("No OBJ files found in the input directory or its subdirectories.")
         sys.exit(1)
     
-    print(f"Found {len(obj_files)} OBJ file(s) to process:")
+    log.info(f"Found {len(obj_files)} OBJ file(s) to process:")
     for obj_file in obj_files:
-        print(f"  - {obj_file}")
+        log.info(f"  - {obj_file}")
     
-    print(f"\nParallelization settings:")
-    print(f"  Max baking workers: {args.max_bake_workers}")
-    print(f"  Max conversion workers: {args.max_conversion_workers}")
+    log.info(f"\nParallelization settings:")
+    log.info(f"  Concurrent OBJ files: {args.jobs}")
+    log.info(f"  Max baking workers: {args.max_bake_workers}")
+    log.info(f"  Max conversion workers: {args.max_conversion_workers}")
     if args.parallel_tiling:
-        print(f"  Parallel tiling: ENABLED (Phase 3)")
-        print(f"  Max tiling workers: {args.max_tiling_workers}")
+        log.info(f"  Parallel tiling: ENABLED (Phase 3)")
+        log.info(f"  Max tiling workers: {args.max_tiling_workers}")
     else:
-        print(f"  Parallel tiling: DISABLED (use --parallel-tiling to enable)")
-    print(f"  Available CPU cores: {multiprocessing.cpu_count()}")
+        log.info(f"  Parallel tiling: DISABLED (use --parallel-tiling to enable)")
+    log.info(f"  Available CPU cores: {multiprocessing.cpu_count()}")
     
+    # Batched tiling: one Blender session tiles every file that will actually
+    # be processed, so the per-file pipeline below skips its Step 1 entirely.
+    # The skip/force decisions normally made inside process_single_obj are
+    # made here first, since tiling a file that would be skipped wastes the
+    # session and pre-tiling creates the output dir the skip check looks for.
+    pretiled_files = set()
+    if args.batch_tiling:
+        if args.parallel_tiling:
+            log.info("\n⚠ --batch-tiling supersedes --parallel-tiling (one Blender session tiles sequentially)")
+
+        tiling_jobs = []
+        for obj_file in obj_files:
+            basename = os.path.splitext(os.path.basename(obj_file))[0]
+            model_output_dir = os.path.join(output_dir, basename)
+            if os.path.exists(model_output_dir):
+                if args.force:
+                    log.info(f"  ⚠ Output directory exists, removing due to --force: {model_output_dir}")
+                    shutil.rmtree(model_output_dir)
+                else:
+                    try:
+                        with open(os.path.join(model_output_dir, _STAMP_NAME)) as f:
+                            previous_stamp = f.read().strip()
+                    except OSError:
+                        previous_stamp = None
+                    if previous_stamp is None or previous_stamp == _pipeline_stamp(obj_file, args):
+                        continue  # process_single_obj will report the skip
+                    log.info(f"  ↻ Source or settings changed since last run - reprocessing: {model_output_dir}")
+                    shutil.rmtree(model_output_dir)
+
+            tiling_jobs.append({
+                "in": obj_file,
+                "out": os.path.join(model_output_dir, "temp", "tiles"),
+                "max_lod": args.lods,
+            })
+            pretiled_files.add(obj_file)
+
+        if tiling_jobs:
+            log.info(f"\nBatch tiling {len(tiling_jobs)} file(s) in one Blender session...")
+            batch_start = time.time()
+            if run_blender_manifest(tiling_jobs, blender_config['exe'],
+                                    blender_config['adaptive_tiling_script']):
+                log.info(f"Batch tiling completed in {time.time() - batch_start:.2f}s")
+            else:
+                log.info("Batch tiling failed - falling back to per-file tiling")
+                # Jobs the session already started created their output dirs
+                # (with partial tiles and no stamp); remove them so the
+                # per-file path reprocesses instead of hitting the
+                # conservative "already exists" skip
+                for job in tiling_jobs:
+                    job_output_dir = os.path.dirname(os.path.dirname(job["out"]))
+                    if (os.path.exists(job_output_dir)
+                            and not os.path.exists(os.path.join(job_output_dir, _STAMP_NAME))):
+                        shutil.rmtree(job_output_dir)
+                pretiled_files.clear()
+
     # Process each OBJ file
     successful_count = 0
     failed_count = 0
     skipped_count = 0
-    
-    for i, obj_file in enumerate(obj_files, 1):
-        print(f"\nProcessing file {i}/{len(obj_files)}")
-        
-        result = process_single_obj(obj_file, output_dir, args, blender_config)
-        
-        if result is True:
-            successful_count += 1
-        elif result is False:
-            failed_count += 1
-            if not args.continue_on_error:
-                print("Stopping due to error. Use --continue-on-error to process remaining files.")
-                break
-        else:  # result is None (skipped)
-            skipped_count += 1
+
+    if args.jobs > 1 and len(obj_files) > 1:
+        # Independent files, so run several through the pipeline at once.
+        # Threads are enough here: each file's time is spent waiting on its
+        # Blender/Node subprocesses, which release the GIL entirely.
+        jobs = min(args.jobs, len(obj_files))
+        log.info(f"\nProcessing {len(obj_files)} files with {jobs} concurrent jobs")
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(process_single_obj, obj_file, output_dir,
+                                   args, blender_config,
+                                   obj_file in pretiled_files): obj_file
+                       for obj_file in obj_files}
+            for future in as_completed(futures):
+                result = future.result()
+                if result is True:
+                    successful_count += 1
+                elif result is False:
+                    failed_count += 1
+                    if not args.continue_on_error:
+                        log.info("Error occurred - cancelling files not yet started. "
+                              "Use --continue-on-error to process remaining files.")
+                        pool.shutdown(cancel_futures=True)
+                        break
+                else:  # result is None (skipped)
+                    skipped_count += 1
+    else:
+        for i, obj_file in enumerate(obj_files, 1):
+            log.info(f"\nProcessing file {i}/{len(obj_files)}")
+
+            result = process_single_obj(obj_file, output_dir, args, blender_config,
+                                        pretiled=obj_file in pretiled_files)
+
+            if result is True:
+                successful_count += 1
+            elif result is False:
+                failed_count += 1
+                if not args.continue_on_error:
+                    log.info("Stopping due to error. Use --continue-on-error to process remaining files.")
+                    break
+            else:  # result is None (skipped)
+                skipped_count += 1
     
     # Summary
-    print(f"\n{'='*60}")
-    print("BATCH PROCESSING COMPLETE")
-    print(f"{'='*60}")
-    print(f"Successfully processed: {successful_count} file(s)")
-    print(f"Skipped (already exists): {skipped_count} file(s)")
-    print(f"Failed to process: {failed_count} file(s)")
-    print(f"Output directory: {output_dir}")
+    log.info(f"\n{'='*60}")
+    log.info("BATCH PROCESSING COMPLETE")
+    log.info(f"{'='*60}")
+    log.info(f"Successfully processed: {successful_count} file(s)")
+    log.info(f"Skipped (already exists): {skipped_count} file(s)")
+    log.info(f"Failed to process: {failed_count} file(s)")
+    log.info(f"Output directory: {output_dir}")
     
     if failed_count > 0 and not args.continue_on_error:
         sys.exit(1)
@@ -34,26 +34,28 @@ def convert_obj_to_glb_blender(input_dir, output_dir, blender_exe, script_path):
     ]
 
     try:
-        result = subprocess.run(
+        # Stream Blender's output instead of buffering it all in memory
+        # (capture_output held hundreds of MB on large scenes) and filter the
+        # progress lines as they arrive, so concurrent conversions interleave
+        # their logs cleanly
+        process = subprocess.Popen(
             cmd,
-            check=True,
-            capture_output=True,
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
         )
+        for line in process.stdout:
+            if '✓' in line or '✗' in line or 'Converting:' in line or '===' in line:
+                print(f"  {line.rstrip()}")
 
-        # Print Blender output
-        if result.stdout:
-            for line in result.stdout.split('\n'):
-                if '✓' in line or '✗' in line or 'Converting:' in line or '===' in line:
-                    print(f"  {line}")
+        returncode = process.wait()
+        if returncode != 0:
+            print(f"  ✗ Blender conversion failed with exit code {returncode}")
+            return False
 
         return True
 
-    except subprocess.CalledProcessError as e:
-        print(f"  ✗ Blender conversion failed with exit code {e.returncode}")
-        if e.stderr:
-            print(f"  Error output: {e.stderr}")
-        return False
     except Exception as e:
         print(f"  ✗ Unexpected error during Blender conversion: {e}")
         return False
@@ -2,65 +2,92 @@ import json
 import argparse
 import os
 import re
-from collections import defaultdict
 import math
 
+# Compiled once; only hit for names the str.split fast path can't handle.
+_TILE_RE = re.compile(r"(\d+)[-_](\d+)[-_](\d+)[-_](\d+)\.glb")
+
 def parse_tile_id(uri):
     """Supports both dash and underscore naming: 2-1-1-1.glb or 2_1_1_1.glb"""
-    match = re.match(r"(\d+)[-_](\d+)[-_](\d+)[-_](\d+)\.glb", uri)
+    # Fast path: plain string ops are an order of magnitude cheaper than a
+    # regex match, and every well-formed tile URI takes this branch.
+    if uri.endswith(".glb"):
+        parts = uri[:-4].replace("-", "_").split("_")
+        if len(parts) == 4:
+            try:
+                return (int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3]))
+            except ValueError:
+                pass
+    match = _TILE_RE.match(uri)
     return tuple(map(int, match.groups())) if match else None
 
 def group_tiles_by_level(children):
-    levels = defaultdict(dict)
+    # Values are plain (info, tile) tuples - one small allocation per tile
+    # instead of a dict wrapper, since both fields are read positionally.
+    # Plain dict + get() beats defaultdict here: no __missing__ dispatch on
+    # every access, and the per-level dict is only created when first seen.
+    levels = {}
     for tile in children:
         info = parse_tile_id(tile["content"]["uri"])
         if info:
-            levels[info[0]][(info[1], info[2], info[3])] = {
-                "info": info,
-                "tile": tile
-            }
+            level_tiles = levels.get(info[0])
+            if level_tiles is None:
+                level_tiles = levels[info[0]] = {}
+            level_tiles[(info[1], info[2], info[3])] = (info, tile)
     return levels
 
 def calculate_bounding_box_diagonal(box):
-    hx = math.sqrt(box[3]**2 + box[4]**2 + box[5]**2)
-    hy = math.sqrt(box[6]**2 + box[7]**2 + box[8]**2)
-    hz = math.sqrt(box[9]**2 + box[10]**2 + box[11]**2)
-    return 2 * math.sqrt(hx**2 + hy**2 + hz**2)
+    # sqrt(hx² + hy² + hz²) where hx² = box[3]²+box[4]²+box[5]² etc. collapses
+    # to one sqrt over the sum of all nine half-axis component squares.
+    return 2 * math.sqrt(sum(b * b for b in box[3:12]))
+
+# Level 0 is None (root calculated separately); levels past 3 halve the
+# level-3 error each step. 32 entries covers any realistic octree depth.
+_GEOMETRIC_ERRORS = [None, 1, 0.5, 0.05] + \
+    [0.05 / (1 << (level - 3)) for level in range(4, 32)]
 
 def get_geometric_error(level):
-    if level == 0:
-        return None  # root calculated separately
-    elif level == 1:
-        return 1
-    elif level == 2:
-        return 0.5
-    elif level == 3:
-        return 0.05
-    else:
-        return 0.05 / (2 ** (level - 3))
-
-def build_hierarchy(current_level, parent_coords, tiles_by_level):
+    if level < len(_GEOMETRIC_ERRORS):
+        return _GEOMETRIC_ERRORS[level]
+    return 0.05 / (1 << (level - 3))
+
+def index_children_by_parent(tiles_by_level):
+    """Build a (level, parent_coords) -> [(info, tile)] map so hierarchy
+    assembly is a direct lookup instead of an O(N²) scan of every child per
+    parent."""
+    children_of = {}
+    for level, tiles in tiles_by_level.items():
+        for coords, data in tiles.items():
+            cx, cy, cz = coords
+            key = (level, cx // 2, cy // 2, cz // 2)
+            children_of.setdefault(key, []).append(data)
+    return children_of
+
+def build_hierarchy(current_level, parent_coords, children_of):
+    """Assemble the nested children list for one parent tile.
+
+    Mutates the flat tileset's tile dicts in place rather than copying
+    them: restructure_tileset consumes flat_tileset and never reuses it,
+    so structural sharing saves one dict copy per tile.
+    """
     next_level = current_level + 1
     children = []
-    for coords, data in tiles_by_level.get(next_level, {}).items():
-        cx, cy, cz = coords
-        px, py, pz = parent_coords
-        if cx // 2 == px and cy // 2 == py and cz // 2 == pz:
-            child = data["tile"].copy()
-            level = data["info"][0]
-            child["geometricError"] = get_geometric_error(level)
-            child["children"] = build_hierarchy(level, coords, tiles_by_level)
-            children.append(child)
+    for info, tile in children_of.get((next_level, *parent_coords), []):
+        level = info[0]
+        tile["geometricError"] = get_geometric_error(level)
+        tile["children"] = build_hierarchy(level, info[1:], children_of)
+        children.append(tile)
     return children
 
-def restructure_tileset(input_path, output_path):
+def restructure_tileset(input_path, output_path, pretty=False):
     with open(input_path, "r") as f:
         flat_tileset = json.load(f)
 
     tiles_by_level = group_tiles_by_level(flat_tileset["root"]["children"])
+    children_of = index_children_by_parent(tiles_by_level)
 
     # Root tile setup
-    root_info, root_tile_data = list(tiles_by_level[0].values())[0]["info"], list(tiles_by_level[0].values())[0]["tile"]
+    root_info, root_tile_data = next(iter(tiles_by_level[0].values()))
     root_box = root_tile_data["boundingVolume"]["box"]
     root_geometric_error = calculate_bounding_box_diagonal(root_box)
 
@@ -69,7 +96,7 @@ def restructure_tileset(input_path, output_path):
         "boundingVolume": root_tile_data["boundingVolume"],
         "geometricError": 1.0,  # Fixed LOD0 error
         "content": {"uri": root_tile_data["content"]["uri"]},
-        "children": build_hierarchy(0, root_info[1:], tiles_by_level)
+        "children": build_hierarchy(0, root_info[1:], children_of)
     }
 
     # Root node becomes structural only (no content)
@@ -89,8 +116,13 @@ def restructure_tileset(input_path, output_path):
         "root": root_tile
     }
 
+    # Compact output by default: the tileset is gzipped downstream, and
+    # indentation only slows serialisation and bloats the pre-gzip size.
     with open(output_path, "w") as f:
-        json.dump(final_tileset, f, indent=2)
+        if pretty:
+            json.dump(final_tileset, f, indent=2)
+        else:
+            json.dump(final_tileset, f, separators=(",", ":"))
 
     print(f"Restructured tileset written to: {output_path}")
 
@@ -1,8 +1,16 @@
 import subprocess
+import json
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+WORKER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "BlenderScripts", "blenderWorker.py")
 
 # This script calls a Blender Python script to split an OBJ file into LODS and then tiles them into chunks.
-def run_blender_script(input_path, output_dir, blender_exe, script_path, extra_args=None):
+def run_blender_script(input_path, output_dir, blender_exe, script_path, extra_args=None, use_worker=False):
 
     """
     Runs the Blender chunking script with given input and output paths.
@@ -13,6 +21,9 @@ def run_blender_script(input_path, output_dir, blender_exe, script_path, extra_a
     - blender_exe: str - Path to Blender executable (e.g., "C:/Program Files/Blender Foundation/Blender 4.0/blender.exe")
     - script_path: str - Path to the Blender Python script
     - extra_args: list - Optional list of additional arguments to pass to the script
+    - use_worker: bool - Route the job through the shared persistent worker
+      instead of launching a fresh Blender (skips the cold start; opt-in
+      because scripts must tolerate a reused, reset scene)
     """
     if not os.path.exists(input_path):
         raise FileNotFoundError(f"Input file not found: {input_path}")
@@ -20,6 +31,15 @@ def run_blender_script(input_path, output_dir, blender_exe, script_path, extra_a
     if not os.path.exists(script_path):
         raise FileNotFoundError(f"Blender script not found: {script_path}")
 
+    if use_worker:
+        worker = get_shared_worker(blender_exe)
+        args = [input_path, output_dir] + (list(extra_args) if extra_args else [])
+        if worker.run_script(script_path, args):
+            print("Blender script completed successfully.")
+        else:
+            print("Blender script failed:")
+        return
+
     command = [
         blender_exe,
         "--background",
@@ -32,14 +52,67 @@ def run_blender_script(input_path, output_dir, blender_exe, script_path, extra_a
         command.extend(extra_args)
 
     print("Running Blender script...")
-    result = subprocess.run(command, capture_output=True, text=True)
+    # Stream output line by line instead of capture_output=True: Blender can
+    # print megabytes of progress on large scenes, which would all sit in
+    # memory (and stay invisible) until the process exits
+    process = subprocess.Popen(command, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in process.stdout:
+        print(line, end="")
+    returncode = process.wait()
 
-    if result.returncode != 0:
+    if returncode != 0:
         print("Blender script failed:")
-        print(result.stderr)
     else:
         print("Blender script completed successfully.")
-        print(result.stdout)
+
+def run_blender_manifest(jobs, blender_exe, script_path):
+    """
+    Run a whole batch of tiling jobs through ONE Blender launch.
+
+    Writes the jobs to a JSON manifest ({"jobs": [{"in": obj_path, "out":
+    output_dir, "max_lod": n}, ...]}) in a temp file and passes its path
+    after `--`; the Blender script loops the entries itself, resetting the
+    scene between them. This pays Blender's multi-second cold start once per
+    batch instead of once per file. Returns True when the session exits
+    cleanly.
+    """
+    if not jobs:
+        return True
+
+    if not os.path.exists(script_path):
+        raise FileNotFoundError(f"Blender script not found: {script_path}")
+    for job in jobs:
+        if not os.path.exists(job["in"]):
+            raise FileNotFoundError(f"Input file not found: {job['in']}")
+
+    fd, manifest_path = tempfile.mkstemp(suffix=".json", prefix="m2t_manifest_")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"jobs": jobs}, f)
+
+        command = [
+            blender_exe,
+            "--background",
+            "--python", script_path,
+            "--", "--manifest", manifest_path
+        ]
+
+        print(f"Running Blender script on {len(jobs)} manifest job(s)...")
+        process = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, bufsize=1)
+        for line in process.stdout:
+            print(line, end="")
+        returncode = process.wait()
+    finally:
+        os.remove(manifest_path)
+
+    if returncode != 0:
+        print("Blender manifest run failed:")
+        return False
+    print("Blender manifest run completed successfully.")
+    return True
+
 
 # This script calls a Blender Python script bake the textures of the tiled chunks - reducing texture size and optimizing for 3D Tiles.
 def run_blender_bake(blender_exe, script_path, input_folder, output_folder):
@@ -47,6 +120,7 @@ def run_blender_bake(blender_exe, script_path, input_folder, output_folder):
         subprocess.run([
             blender_exe,
             "--background",
+            "--factory-startup",
             "--python", script_path,
             "--",
             "--input", input_folder,
@@ -56,3 +130,136 @@ def run_blender_bake(blender_exe, script_path, input_folder, output_folder):
     except subprocess.CalledProcessError as e:
         print(f"Bake failed for {input_folder}: {e}")
 
+
+def run_blender_bake_batch(blender_exe, script_path, folder_pairs, max_workers=None):
+    """
+    Bake several chunk folders concurrently. Each bake is an independent
+    Blender process, so wall-clock scales with cores until disk I/O saturates.
+
+    Parameters:
+    - folder_pairs: list of (input_folder, output_folder) tuples
+    - max_workers: bound on concurrent Blender processes; defaults to half the
+      CPUs since each bake is memory-heavy and multi-threaded internally
+    """
+    if not folder_pairs:
+        return
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+    max_workers = min(max_workers, len(folder_pairs))
+
+    print(f"Baking {len(folder_pairs)} folders with {max_workers} workers...")
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(run_blender_bake, blender_exe, script_path,
+                               input_folder, output_folder)
+                   for input_folder, output_folder in folder_pairs]
+        for future in futures:
+            future.result()
+
+
+class BlenderWorker:
+    """
+    A persistent background Blender process that runs pipeline scripts sent as
+    JSON jobs over stdin (see BlenderScripts/blenderWorker.py). Blender's cold
+    start is multi-second, so for runs with many tiles paying it once instead
+    of once per script invocation is a large win.
+
+    Usage:
+        with BlenderWorker(blender_exe) as worker:
+            worker.run_script(script_path, [input_path, output_dir])
+            worker.run_script(bake_script, ["--input", folder, "--output", out])
+    """
+
+    def __init__(self, blender_exe):
+        self.blender_exe = blender_exe
+        self.process = None
+        # Jobs are serialized over one stdin/stdout pair, so concurrent
+        # callers (e.g. the bake thread pool) must take turns
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self.process is not None:
+            return
+        self.process = subprocess.Popen(
+            [self.blender_exe, "--background", "--factory-startup",
+             "--python", WORKER_SCRIPT],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+
+    def run_script(self, script_path, args=None):
+        """Run one pipeline script inside the worker; returns True on success."""
+        if not os.path.exists(script_path):
+            raise FileNotFoundError(f"Blender script not found: {script_path}")
+
+        with self._lock:
+            self.start()
+
+            job = {"script": script_path, "args": list(args) if args else []}
+            self.process.stdin.write(json.dumps(job) + "\n")
+            self.process.stdin.flush()
+
+            # The job script's own prints go to the worker's stdout too; scan
+            # for the one-line JSON response that terminates each job.
+            for line in self.process.stdout:
+                line = line.strip()
+                if line.startswith("{"):
+                    try:
+                        response = json.loads(line)
+                    except ValueError:
+                        continue
+                    if "ok" in response:
+                        if not response["ok"]:
+                            print(f"Blender worker job failed: {response.get('error')}")
+                        return response["ok"]
+                elif line:
+                    print(line)
+
+            # Worker died mid-job
+            self.process = None
+            print("Blender worker exited unexpectedly")
+            return False
+
+    def close(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.write("\n")
+            self.process.stdin.flush()
+            self.process.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+        self.process = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+
+# Process-wide persistent worker, shared so every pipeline stage of every OBJ
+# in a batch reuses one hot Blender instead of paying the multi-second cold
+# start per stage
+_shared_worker = None
+_shared_worker_lock = threading.Lock()
+
+
+def get_shared_worker(blender_exe):
+    """Return the process-wide BlenderWorker, starting it on first use."""
+    global _shared_worker
+    with _shared_worker_lock:
+        if _shared_worker is None or _shared_worker.blender_exe != blender_exe:
+            if _shared_worker is not None:
+                _shared_worker.close()
+            _shared_worker = BlenderWorker(blender_exe)
+            _shared_worker.start()
+        return _shared_worker
+
+
+def close_shared_worker():
+    """Shut down the shared worker (call once at the end of a batch)."""
+    global _shared_worker
+    with _shared_worker_lock:
+        if _shared_worker is not None:
+            _shared_worker.close()
+            _shared_worker = None
+